@@ -26,6 +26,12 @@ class Action(BaseModel):
 class ActionProvider(Generic[TWalletProvider], ABC):
     """Base class for all action providers."""
 
+    # Providers that are network-agnostic set this to True so callers can skip
+    # the supports_network check entirely. The flag is inherited: a subclass that
+    # overrides supports_network to restrict networks must set it back to False,
+    # otherwise its supports_network is never consulted.
+    SUPPORTS_ALL_NETWORKS: bool = False
+
     def __init__(
         self, name: str, action_providers: list["ActionProvider[TWalletProvider]"]
     ) -> None:
@@ -24,6 +24,8 @@ class CdpApiActionProvider(ActionProvider[TWalletProvider]):
     This provider is used for any action that uses the CDP API, but does not require a CDP Wallet.
     """
 
+    SUPPORTS_ALL_NETWORKS = True
+
     def __init__(self):
         """Initialize the CdpApiActionProvider class."""
         super().__init__("cdp_api", [])
@@ -32,6 +32,8 @@ class CdpSmartWalletActionProvider(ActionProvider[TWalletProvider]):
     that are optimized for smart wallet functionality.
     """
 
+    SUPPORTS_ALL_NETWORKS = True
+
     def __init__(self):
         super().__init__("cdp_smart_wallet", [])
 
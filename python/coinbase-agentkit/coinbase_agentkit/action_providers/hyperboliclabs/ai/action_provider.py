@@ -27,6 +27,8 @@ from .utils import save_base64_data, save_text
 class AIActionProvider(ActionProvider):
     """Action provider for generating text, images and audio via AI."""
 
+    SUPPORTS_ALL_NETWORKS = True
+
     description = "Action provider for generating text, images and audio via AI."
 
     def __init__(
@@ -29,6 +29,8 @@ class BillingActionProvider(ActionProvider):
     through the HYPERBOLIC_API_KEY environment variable.
     """
 
+    SUPPORTS_ALL_NETWORKS = True
+
     def __init__(
         self,
         api_key: str | None = None,
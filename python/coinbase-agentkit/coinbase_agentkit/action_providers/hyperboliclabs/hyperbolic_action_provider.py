@@ -34,6 +34,8 @@ class HyperbolicActionProvider(ActionProvider):
     HYPERBOLIC_API_KEY environment variable.
     """
 
+    SUPPORTS_ALL_NETWORKS = True
+
     def __init__(
         self,
         api_key: str | None = None,
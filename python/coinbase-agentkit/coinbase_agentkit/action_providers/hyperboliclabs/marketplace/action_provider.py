@@ -35,6 +35,8 @@ class MarketplaceActionProvider(ActionProvider):
     environment variable.
     """
 
+    SUPPORTS_ALL_NETWORKS = True
+
     def __init__(
         self,
         api_key: str | None = None,
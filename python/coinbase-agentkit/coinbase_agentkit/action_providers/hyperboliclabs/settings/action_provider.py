@@ -22,6 +22,8 @@ class SettingsActionProvider(ActionProvider):
     through the HYPERBOLIC_API_KEY environment variable.
     """
 
+    SUPPORTS_ALL_NETWORKS = True
+
     def __init__(
         self,
         api_key: str | None = None,
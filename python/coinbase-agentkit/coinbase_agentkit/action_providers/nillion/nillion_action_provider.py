@@ -28,6 +28,8 @@ from coinbase_agentkit.network import Network
 class NillionActionProvider(ActionProvider):
     """Provides actions for interacting with Nillion SecretVault storage."""
 
+    SUPPORTS_ALL_NETWORKS = True
+
     def __init__(self, llm: Any, org_did: str | None = None, secret_key: str | None = None):
         super().__init__("nillion", [])
 
@@ -15,6 +15,8 @@ from .schemas import FetchPriceFeedSchema, FetchPriceSchema
 class PythActionProvider(ActionProvider[WalletProvider]):
     """Provides actions for interacting with Pyth price feeds."""
 
+    SUPPORTS_ALL_NETWORKS = True
+
     def __init__(self):
         super().__init__("pyth", [])
 
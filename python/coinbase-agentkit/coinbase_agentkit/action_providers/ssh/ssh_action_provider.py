@@ -38,6 +38,8 @@ class SshActionProvider(ActionProvider):
     It supports managing multiple concurrent SSH connections.
     """
 
+    SUPPORTS_ALL_NETWORKS = True
+
     def __init__(self, max_connections: int = 10):
         """Initialize the SshActionProvider."""
         super().__init__("ssh", [])
@@ -18,6 +18,8 @@ from .schemas import (
 class TwitterActionProvider(ActionProvider):
     """Provides actions for interacting with Twitter."""
 
+    SUPPORTS_ALL_NETWORKS = True
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -39,6 +39,8 @@ DEFAULT_TERMINOLOGY = {
 class WalletActionProvider(ActionProvider[WalletProvider]):
     """Provides actions for interacting with wallet functionality."""
 
+    SUPPORTS_ALL_NETWORKS = True
+
     def __init__(self):
         super().__init__("wallet", [])
 
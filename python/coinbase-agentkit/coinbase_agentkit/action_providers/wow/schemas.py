@@ -2,7 +2,7 @@
 
 from pydantic import BaseModel, Field, field_validator
 
-from ...validators.eth import validate_eth_address
+from ...validators.eth import validate_eth_address, validate_wei_amount
 
 
 class WowBuyTokenSchema(BaseModel):
@@ -10,7 +10,9 @@ class WowBuyTokenSchema(BaseModel):
 
     contract_address: str = Field(..., description="The WOW token contract address")
     amount_eth_in_wei: str = Field(
-        ..., description="Amount of ETH to spend (in wei)", pattern=r"^\d+$"
+        ...,
+        description="Amount of ETH to spend (in wei)",
+        json_schema_extra={"pattern": r"^\d+$"},
     )
 
     @field_validator("contract_address")
@@ -30,6 +32,23 @@ class WowBuyTokenSchema(BaseModel):
         """
         return validate_eth_address(v)
 
+    @field_validator("amount_eth_in_wei")
+    @classmethod
+    def validate_amount(cls, v: str) -> str:
+        """Validate that the amount is a non-negative integer string.
+
+        Args:
+            v (str): The amount in wei to validate
+
+        Returns:
+            str: The validated amount
+
+        Raises:
+            ValueError: If the amount contains anything other than decimal digits
+
+        """
+        return validate_wei_amount(v)
+
 
 class WowCreateTokenSchema(BaseModel):
     """Input schema for creating WOW tokens."""
@@ -46,7 +65,9 @@ class WowSellTokenSchema(BaseModel):
 
     contract_address: str = Field(..., description="The WOW token contract address")
     amount_tokens_in_wei: str = Field(
-        ..., description="Amount of tokens to sell (in wei)", pattern=r"^\d+$"
+        ...,
+        description="Amount of tokens to sell (in wei)",
+        json_schema_extra={"pattern": r"^\d+$"},
     )
 
     @field_validator("contract_address")
@@ -65,3 +86,20 @@ class WowSellTokenSchema(BaseModel):
 
         """
         return validate_eth_address(v)
+
+    @field_validator("amount_tokens_in_wei")
+    @classmethod
+    def validate_amount(cls, v: str) -> str:
+        """Validate that the amount is a non-negative integer string.
+
+        Args:
+            v (str): The amount in wei to validate
+
+        Returns:
+            str: The validated amount
+
+        Raises:
+            ValueError: If the amount contains anything other than decimal digits
+
+        """
+        return validate_wei_amount(v)
@@ -62,9 +62,10 @@ class AgentKit:
         if not self.wallet_provider:
             raise ValueError("No wallet provider configured")
 
+        network = self.wallet_provider.get_network()
         actions: list[Action] = []
         for provider in self.action_providers:
-            if provider.supports_network(self.wallet_provider.get_network()):
+            if provider.SUPPORTS_ALL_NETWORKS or provider.supports_network(network):
                 actions.extend(provider.get_actions(self.wallet_provider))
 
         return actions
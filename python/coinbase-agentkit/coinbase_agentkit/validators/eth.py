@@ -20,3 +20,21 @@ def validate_eth_address(value: str) -> str:
         return Web3.to_checksum_address(value)
     except ValueError as e:
         raise ValueError("Invalid Ethereum address") from e
+
+
+def validate_wei_amount(value: str) -> str:
+    """Validate wei amount format.
+
+    Args:
+        value: The amount to validate
+
+    Returns:
+        The validated amount
+
+    Raises:
+        ValueError: If the amount is invalid
+
+    """
+    if not (value.isascii() and value.isdigit()):
+        raise ValueError("Amount must be a whole number of wei")
+    return value
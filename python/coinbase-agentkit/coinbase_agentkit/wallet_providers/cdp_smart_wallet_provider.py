@@ -2,19 +2,256 @@
 
 import asyncio
 import os
+import threading
+import weakref
+from collections import Counter, OrderedDict
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
+import requests
 from cdp import CdpClient
 from cdp.evm_call_types import EncodedCall
 from eth_account import Account
 from pydantic import BaseModel, Field
-from web3 import Web3
+from requests.adapters import HTTPAdapter
+from web3 import AsyncHTTPProvider, AsyncWeb3, HTTPProvider, Web3, WebSocketProvider
+
+# HTTPSessionManager is private to web3, so the web3 dependency is pinned to the minor
+# versions whose session manager interface _PooledHTTPSessionManager has been checked against
+from web3._utils.http_session_manager import HTTPSessionManager
+from web3.contract import AsyncContract, Contract
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from web3.providers.rpc.utils import ExceptionRetryConfiguration
 from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
 
 from ..network import NETWORK_ID_TO_CHAIN, Network
 from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
 
+# Maximum number of compiled contract objects kept per provider by read_contract
+CONTRACT_CACHE_SIZE = 128
+
+# Read-only JSON-RPC methods that are safe to resend when a request fails. web3's default
+# retry allowlist also covers eth_sendRawTransaction, which must never be sent twice.
+RPC_RETRY_METHODS = [
+    "eth_blockNumber",
+    "eth_call",
+    "eth_chainId",
+    "eth_estimateGas",
+    "eth_feeHistory",
+    "eth_gasPrice",
+    "eth_getBalance",
+    "eth_getBlockByHash",
+    "eth_getBlockByNumber",
+    "eth_getCode",
+    "eth_getLogs",
+    "eth_getStorageAt",
+    "eth_getTransactionByHash",
+    "eth_getTransactionCount",
+    "eth_getTransactionReceipt",
+    "eth_maxPriorityFeePerGas",
+]
+
+
+def _create_rpc_session(pool_size: int) -> requests.Session:
+    """Create an HTTP session for JSON-RPC calls with a connection pool of the given size.
+
+    Args:
+        pool_size (int): The maximum number of pooled connections per host
+
+    Returns:
+        requests.Session: A session that reuses connections across requests
+
+    """
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class _ThreadSession:
+    """A thread's RPC session, closed once the thread's local storage releases it."""
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+        weakref.finalize(self, session.close)
+
+
+class _PooledHTTPSessionManager(HTTPSessionManager):
+    """HTTP session manager that gives every thread its own pooled session.
+
+    web3 caches one requests session per thread, so a session passed to HTTPProvider is
+    only used by the thread that created the provider. This manager builds a session from
+    _create_rpc_session the first time each thread makes a request instead, and closes it
+    when the thread exits.
+    """
+
+    def __init__(self, pool_size: int):
+        super().__init__()
+        self._pool_size = pool_size
+        self._thread_sessions = threading.local()
+
+    def cache_and_return_session(
+        self,
+        endpoint_uri: str,
+        session: requests.Session | None = None,
+        request_timeout: float | None = None,
+    ) -> requests.Session:
+        """Get the calling thread's session, creating a pooled one on first use.
+
+        Args:
+            endpoint_uri (str): The JSON-RPC endpoint URL
+            session (requests.Session | None): Unused, every thread gets its own pooled session
+            request_timeout (float | None): Unused, kept for HTTPSessionManager compatibility
+
+        Returns:
+            requests.Session: The calling thread's session
+
+        """
+        thread_session = getattr(self._thread_sessions, "thread_session", None)
+        if thread_session is None:
+            thread_session = _ThreadSession(_create_rpc_session(self._pool_size))
+            self._thread_sessions.thread_session = thread_session
+        return thread_session.session
+
+
+class _PooledHTTPProvider(HTTPProvider):
+    """HTTP provider whose requests go through the given pooled session manager.
+
+    Failed requests are retried only for the read-only methods in RPC_RETRY_METHODS.
+    """
+
+    def __init__(self, endpoint_uri: str, session_manager: _PooledHTTPSessionManager):
+        super().__init__(
+            endpoint_uri,
+            exception_retry_configuration=ExceptionRetryConfiguration(
+                errors=(requests.ConnectionError, requests.HTTPError, requests.Timeout),
+                retries=3,
+                backoff_factor=0.1,
+                method_allowlist=RPC_RETRY_METHODS,
+            ),
+        )
+        self._request_session_manager = session_manager
+
+
+@lru_cache(maxsize=32)
+def _get_session_manager(pool_size: int) -> _PooledHTTPSessionManager:
+    """Get the session manager for a pool size, shared by every smart wallet provider.
+
+    Only the sessions are shared: web3 keeps batching state on the HTTPProvider, so each
+    wallet provider builds its own provider on top of this manager. A session pools
+    connections per host, so one manager serves every RPC endpoint.
+
+    Args:
+        pool_size (int): The maximum number of pooled connections per host
+
+    Returns:
+        _PooledHTTPSessionManager: The session manager for the pool size
+
+    """
+    return _PooledHTTPSessionManager(pool_size)
+
+
+class _NewHeadsReceiptWatcher:
+    """Resolves the receipt waits on one event loop from a single newHeads subscription.
+
+    Each pending transaction hash maps to a future. The receipts of all pending hashes are
+    checked once after subscribing and again on each new head, so concurrent waits share one
+    WebSocket connection. The connection is closed once no waits are pending.
+    """
+
+    def __init__(self, ws_url: str):
+        self._ws_url = ws_url
+        self._pending: dict[HexStr, asyncio.Future] = {}
+        self._waiter_counts: Counter[HexStr] = Counter()
+        self._w3: AsyncWeb3 | None = None
+        self._task: asyncio.Task | None = None
+
+    async def wait_for_receipt(self, tx_hash: HexStr, timeout: float) -> Any:
+        """Wait for a transaction receipt.
+
+        Args:
+            tx_hash (HexStr): The transaction hash to wait for
+            timeout (float): Maximum time to wait in seconds
+
+        Returns:
+            Any: The transaction receipt
+
+        Raises:
+            TimeExhausted: If transaction is not mined within timeout period
+
+        """
+        loop = asyncio.get_running_loop()
+        future = self._pending.get(tx_hash)
+        if future is None:
+            future = self._pending[tx_hash] = loop.create_future()
+        self._waiter_counts[tx_hash] += 1
+        try:
+            if self._task is None:
+                self._task = loop.create_task(self._watch())
+            elif self._w3 is not None and not future.done():
+                # Already subscribed, so the check after subscribing did not cover this hash
+                self._resolve(future, await self._get_receipt(self._w3, tx_hash))
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError as e:
+            raise TimeExhausted(
+                f"Transaction {tx_hash} is not in the chain after {timeout} seconds"
+            ) from e
+        finally:
+            self._waiter_counts[tx_hash] -= 1
+            if not self._waiter_counts[tx_hash]:
+                del self._waiter_counts[tx_hash]
+                del self._pending[tx_hash]
+            if not self._pending:
+                await self._stop()
+
+    async def _watch(self) -> None:
+        """Check the pending receipts on each new head until stopped."""
+        try:
+            async with AsyncWeb3(WebSocketProvider(self._ws_url)) as w3:
+                # Subscribe before the first check so a block landing in between is not missed
+                await w3.eth.subscribe("newHeads")
+                self._w3 = w3
+                await self._check_pending(w3)
+                async for _ in w3.socket.process_subscriptions():
+                    await self._check_pending(w3)
+            raise ConnectionError("The newHeads subscription closed")
+        except Exception as e:
+            if self._task is not asyncio.current_task():
+                return
+            self._task, self._w3 = None, None
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _stop(self) -> None:
+        """Close the subscription and its connection."""
+        task, self._task, self._w3 = self._task, None, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _check_pending(self, w3: AsyncWeb3) -> None:
+        """Resolve the futures of the pending transactions that have a receipt."""
+        for tx_hash, future in list(self._pending.items()):
+            if not future.done():
+                self._resolve(future, await self._get_receipt(w3, tx_hash))
+
+    @staticmethod
+    async def _get_receipt(w3: AsyncWeb3, tx_hash: HexStr) -> Any:
+        """Get a transaction receipt, or None if the transaction is not mined yet."""
+        try:
+            return await w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, receipt: Any) -> None:
+        """Resolve a pending future with a receipt, if there is one."""
+        if receipt is not None and not future.done():
+            future.set_result(receipt)
+
 
 class CdpSmartWalletProviderConfig(BaseModel):
     """Configuration options for CDP EVM Smart Wallet provider."""
@@ -32,6 +269,23 @@ class CdpSmartWalletProviderConfig(BaseModel):
         None, description="Optional paymaster URL for gasless transactions"
     )
     rpc_url: str | None = Field(None, description="Optional RPC URL to override default chain RPC")
+    rpc_pool_size: int = Field(
+        50,
+        gt=0,
+        description=(
+            "Maximum number of pooled HTTP connections to the RPC endpoint. Applies to the "
+            "synchronous methods only; the async_* methods use web3's default aiohttp session"
+        ),
+    )
+    receipt_poll_latency: float = Field(
+        1.0,
+        gt=0,
+        description="Seconds between transaction receipt polls when waiting for a receipt",
+    )
+    ws_url: str | None = Field(
+        None,
+        description="Optional WebSocket RPC URL used to wait for receipts on new blocks instead of polling",
+    )
 
 
 class CdpSmartWalletProvider(EvmWalletProvider):
@@ -53,6 +307,11 @@ class CdpSmartWalletProvider(EvmWalletProvider):
             self._api_key_secret = config.api_key_secret or os.getenv("CDP_API_KEY_SECRET")
             self._wallet_secret = config.wallet_secret or os.getenv("CDP_WALLET_SECRET")
             self._paymaster_url = config.paymaster_url
+            self._receipt_poll_latency = config.receipt_poll_latency
+            self._ws_url = config.ws_url
+            self._receipt_watchers: weakref.WeakKeyDictionary[
+                asyncio.AbstractEventLoop, _NewHeadsReceiptWatcher
+            ] = weakref.WeakKeyDictionary()
             owner_address_or_private_key = config.owner or os.getenv("OWNER")
 
             if not self._api_key_id or not self._api_key_secret or not self._wallet_secret:
@@ -73,7 +332,19 @@ class CdpSmartWalletProvider(EvmWalletProvider):
                 network_id=network_id,
                 chain_id=chain.id,
             )
-            self._web3 = Web3(Web3.HTTPProvider(rpc_url))
+            session_manager = _get_session_manager(config.rpc_pool_size)
+            self._web3 = Web3(_PooledHTTPProvider(rpc_url, session_manager))
+            # web3 marks the whole provider as batching, so batches run one at a time on a
+            # provider of their own and never turn concurrent single reads into placeholders
+            self._batch_web3 = Web3(_PooledHTTPProvider(rpc_url, session_manager))
+            self._batch_lock = threading.Lock()
+            # Built on first use by the async_* methods, so sync-only providers never create it
+            self._rpc_url = rpc_url
+            self._async_web3: AsyncWeb3 | None = None
+            self._contract_caches: dict[
+                Web3 | AsyncWeb3,
+                OrderedDict[tuple[str, int], tuple[list[dict[str, Any]], Contract | AsyncContract]],
+            ] = {}
 
             client = self.get_client()
             try:
@@ -220,6 +491,126 @@ class CdpSmartWalletProvider(EvmWalletProvider):
             )
         return smart_account
 
+    async def _send_user_operation(self, calls: list[EncodedCall]) -> Any:
+        """Send a user operation and wait for it to complete.
+
+        Args:
+            calls (list[EncodedCall]): The encoded calls to execute in the user operation
+
+        Returns:
+            Any: The completed user operation, including its transaction hash
+
+        """
+        client = self.get_client()
+        try:
+            async with client as cdp:
+                smart_account = await self._get_smart_account(cdp)
+                user_operation = await cdp.evm.send_user_operation(
+                    smart_account=smart_account,
+                    network=self._get_cdp_sdk_network(),
+                    calls=calls,
+                    paymaster_url=self._paymaster_url,
+                )
+                return await cdp.evm.wait_for_user_operation(
+                    smart_account_address=self._address,
+                    user_op_hash=user_operation.user_op_hash,
+                )
+        finally:
+            await client.close()
+
+    async def _wait_for_receipt_on_new_heads(self, tx_hash: HexStr, timeout: float) -> Any:
+        """Wait for a transaction receipt, checking for it once per new block.
+
+        A receipt can only appear once a new block is produced, so instead of polling on a fixed
+        interval this waits on a newHeads subscription over the WebSocket RPC. Waits on the same
+        event loop share one connection and subscription. Each synchronous wait runs on its own
+        event loop, so it opens a connection of its own.
+
+        Args:
+            tx_hash (HexStr): The transaction hash to wait for
+            timeout (float): Maximum time to wait in seconds
+
+        Returns:
+            Any: The transaction receipt
+
+        Raises:
+            TimeExhausted: If transaction is not mined within timeout period
+
+        """
+        loop = asyncio.get_running_loop()
+        watcher = self._receipt_watchers.get(loop)
+        if watcher is None:
+            watcher = self._receipt_watchers[loop] = _NewHeadsReceiptWatcher(self._ws_url)
+        return await watcher.wait_for_receipt(tx_hash, timeout)
+
+    @staticmethod
+    def _transaction_to_calls(transaction: TxParams) -> list[EncodedCall]:
+        """Convert transaction parameters to the encoded calls of a user operation.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Returns:
+            list[EncodedCall]: A single encoded call for the transaction
+
+        """
+        return [
+            EncodedCall(
+                to=transaction["to"],
+                value=transaction.get("value", 0),
+                data=transaction.get("data", "0x"),
+            )
+        ]
+
+    def _get_async_web3(self) -> AsyncWeb3:
+        """Get the AsyncWeb3 instance used by the async_* methods, creating it on first use.
+
+        Returns:
+            AsyncWeb3: The AsyncWeb3 instance for the RPC URL
+
+        """
+        if self._async_web3 is None:
+            self._async_web3 = AsyncWeb3(AsyncHTTPProvider(self._rpc_url))
+        return self._async_web3
+
+    def _get_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        web3: Web3 | AsyncWeb3 | None = None,
+    ) -> Contract | AsyncContract:
+        """Get a contract object, reusing a cached one for the same address and ABI object.
+
+        Building a contract parses the ABI into encoders and decoders, so the result is cached
+        by the ABI's identity. The ABI is kept in the cache entry so its id cannot be reused.
+        Each web3 instance has its own cache, as a contract sends its calls through the
+        instance it was built on.
+
+        Args:
+            contract_address (ChecksumAddress): The address of the contract
+            abi (list[dict[str, Any]]): The ABI of the contract
+            web3 (Web3 | AsyncWeb3 | None): The web3 instance to build the contract on,
+                defaults to the one used for single reads
+
+        Returns:
+            Contract | AsyncContract: The web3 contract object
+
+        """
+        if web3 is None:
+            web3 = self._web3
+        cache = self._contract_caches.setdefault(web3, OrderedDict())
+
+        key = (contract_address, id(abi))
+        cached = cache.get(key)
+        if cached is not None and cached[0] is abi:
+            return cached[1]
+
+        contract = web3.eth.contract(address=contract_address, abi=abi)
+        cache[key] = (abi, contract)
+        if len(cache) > CONTRACT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return contract
+
     def get_address(self) -> str:
         """Get the wallet address.
 
@@ -239,6 +630,24 @@ class CdpSmartWalletProvider(EvmWalletProvider):
         balance = self._web3.eth.get_balance(self.get_address())
         return Decimal(balance)
 
+    def get_balances(self, addresses: list[str]) -> list[Decimal]:
+        """Get the native currency balances of several addresses in one batched RPC request.
+
+        Args:
+            addresses (list[str]): The addresses to get balances for
+
+        Returns:
+            list[Decimal]: The balances in wei, in the same order as the addresses
+
+        """
+        if not addresses:
+            return []
+
+        with self._batch_lock, self._batch_web3.batch_requests() as batch:
+            for address in addresses:
+                batch.add(self._batch_web3.eth.get_balance(address))
+            return [Decimal(balance) for balance in batch.execute()]
+
     def get_name(self) -> str:
         """Get the name of the wallet provider.
 
@@ -269,27 +678,8 @@ class CdpSmartWalletProvider(EvmWalletProvider):
 
         """
         value_wei = Web3.to_wei(value, "ether")
-        client = self.get_client()
-
-        async def _send_user_operation():
-            async with client as cdp:
-                smart_account = await self._get_smart_account(cdp)
-
-                user_operation = await cdp.evm.send_user_operation(
-                    smart_account=smart_account,
-                    network=self._get_cdp_sdk_network(),
-                    calls=[EncodedCall(to=to, value=value_wei, data="0x")],
-                    paymaster_url=self._paymaster_url,
-                )
-                return await cdp.evm.wait_for_user_operation(
-                    smart_account_address=self._address,
-                    user_op_hash=user_operation.user_op_hash,
-                )
-
-        try:
-            return self._run_async(_send_user_operation()).transaction_hash
-        finally:
-            self._run_async(client.close())
+        calls = [EncodedCall(to=to, value=value_wei, data="0x")]
+        return self._run_async(self._send_user_operation(calls)).transaction_hash
 
     def read_contract(
         self,
@@ -312,12 +702,38 @@ class CdpSmartWalletProvider(EvmWalletProvider):
             Any: The result of the contract function call
 
         """
-        contract = self._web3.eth.contract(address=contract_address, abi=abi)
+        contract = self._get_contract(contract_address, abi)
         func = contract.functions[function_name]
         if args is None:
             args = []
         return func(*args).call(block_identifier=block_identifier)
 
+    def read_contracts(
+        self,
+        calls: list[tuple[ChecksumAddress, list[dict[str, Any]], str, list[Any] | None]],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[Any]:
+        """Read data from several smart contracts in one batched RPC request.
+
+        Args:
+            calls (list[tuple[ChecksumAddress, list[dict[str, Any]], str, list[Any] | None]]):
+                The calls to make, each as (contract_address, abi, function_name, args)
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[Any]: The results of the contract function calls, in the same order as the calls
+
+        """
+        if not calls:
+            return []
+
+        with self._batch_lock, self._batch_web3.batch_requests() as batch:
+            for contract_address, abi, function_name, args in calls:
+                contract = self._get_contract(contract_address, abi, self._batch_web3)
+                func = contract.functions[function_name]
+                batch.add(func(*(args or [])).call(block_identifier=block_identifier))
+            return batch.execute()
+
     def send_transaction(self, transaction: TxParams) -> HexStr:
         """Send a transaction using a user operation.
 
@@ -328,42 +744,22 @@ class CdpSmartWalletProvider(EvmWalletProvider):
             HexStr: The transaction hash as a hex string
 
         """
-        client = self.get_client()
-
-        async def _send_user_operation():
-            async with client as cdp:
-                smart_account = await self._get_smart_account(cdp)
-                user_operation = await cdp.evm.send_user_operation(
-                    smart_account=smart_account,
-                    network=self._get_cdp_sdk_network(),
-                    calls=[
-                        EncodedCall(
-                            to=transaction["to"],
-                            value=transaction.get("value", 0),
-                            data=transaction.get("data", "0x"),
-                        )
-                    ],
-                    paymaster_url=self._paymaster_url,
-                )
-                return await cdp.evm.wait_for_user_operation(
-                    smart_account_address=self._address,
-                    user_op_hash=user_operation.user_op_hash,
-                )
-
-        try:
-            return self._run_async(_send_user_operation()).transaction_hash
-        finally:
-            self._run_async(client.close())
+        return self._run_async(
+            self._send_user_operation(self._transaction_to_calls(transaction))
+        ).transaction_hash
 
     def wait_for_transaction_receipt(
-        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float | None = None
     ) -> dict[str, Any]:
         """Wait for transaction confirmation and return receipt.
 
         Args:
             tx_hash (HexStr): The transaction hash to wait for
             timeout (float): Maximum time to wait in seconds, defaults to 120
-            poll_latency (float): Time between polling attempts in seconds, defaults to 0.1
+            poll_latency (float | None): Time between polling attempts in seconds, defaults to
+                the configured receipt_poll_latency (1 second unless overridden). Silently
+                ignored when a ws_url is configured, as the receipt is then checked on each new
+                block instead
 
         Returns:
             dict[str, Any]: The transaction receipt as a dictionary
@@ -372,6 +768,12 @@ class CdpSmartWalletProvider(EvmWalletProvider):
             TimeoutError: If transaction is not mined within timeout period
 
         """
+        if self._ws_url:
+            return self._run_async(self._wait_for_receipt_on_new_heads(tx_hash, timeout))
+
+        if poll_latency is None:
+            poll_latency = self._receipt_poll_latency
+
         return self._web3.eth.wait_for_transaction_receipt(
             tx_hash, timeout=timeout, poll_latency=poll_latency
         )
@@ -457,23 +859,90 @@ class CdpSmartWalletProvider(EvmWalletProvider):
             str: The transaction hash of the executed user operation
 
         """
-        client = self.get_client()
+        return self._run_async(self._send_user_operation(calls)).transaction_hash
 
-        async def _send_user_operation():
-            async with client as cdp:
-                smart_account = await self._get_smart_account(cdp)
-                user_operation = await cdp.evm.send_user_operation(
-                    smart_account=smart_account,
-                    network=self._get_cdp_sdk_network(),
-                    calls=calls,
-                    paymaster_url=self._paymaster_url,
-                )
-                return await cdp.evm.wait_for_user_operation(
-                    smart_account_address=self._address,
-                    user_op_hash=user_operation.user_op_hash,
-                )
+    async def async_get_balance(self) -> Decimal:
+        """Get the wallet balance in native currency without blocking the event loop.
 
-        try:
-            return self._run_async(_send_user_operation()).transaction_hash
-        finally:
-            self._run_async(client.close())
+        The async_* methods share web3's default aiohttp session rather than the connection
+        pool configured by rpc_pool_size.
+
+        Returns:
+            Decimal: The wallet's balance in wei as a Decimal
+
+        """
+        balance = await self._get_async_web3().eth.get_balance(self.get_address())
+        return Decimal(balance)
+
+    async def async_read_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read data from a smart contract without blocking the event loop.
+
+        Contracts are cached like in read_contract, but requests go through web3's default
+        aiohttp session rather than the connection pool configured by rpc_pool_size.
+
+        Args:
+            contract_address (ChecksumAddress): The address of the contract to read from
+            abi (list[dict[str, Any]]): The ABI of the contract
+            function_name (str): The name of the function to call
+            args (list[Any] | None): Arguments to pass to the function call, defaults to empty list
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            Any: The result of the contract function call
+
+        """
+        contract = self._get_contract(contract_address, abi, self._get_async_web3())
+        func = contract.functions[function_name]
+        if args is None:
+            args = []
+        return await func(*args).call(block_identifier=block_identifier)
+
+    async def async_send_transaction(self, transaction: TxParams) -> HexStr:
+        """Send a transaction using a user operation without blocking the event loop.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        """
+        user_operation = await self._send_user_operation(self._transaction_to_calls(transaction))
+        return user_operation.transaction_hash
+
+    async def async_wait_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float | None = None
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation without blocking the event loop.
+
+        Args:
+            tx_hash (HexStr): The transaction hash to wait for
+            timeout (float): Maximum time to wait in seconds, defaults to 120
+            poll_latency (float | None): Time between polling attempts in seconds, defaults to
+                the configured receipt_poll_latency (1 second unless overridden). Silently
+                ignored when a ws_url is configured, as the receipt is then checked on each new
+                block instead
+
+        Returns:
+            dict[str, Any]: The transaction receipt as a dictionary
+
+        Raises:
+            TimeoutError: If transaction is not mined within timeout period
+
+        """
+        if self._ws_url:
+            return await self._wait_for_receipt_on_new_heads(tx_hash, timeout)
+
+        if poll_latency is None:
+            poll_latency = self._receipt_poll_latency
+
+        return await self._get_async_web3().eth.wait_for_transaction_receipt(
+            tx_hash, timeout=timeout, poll_latency=poll_latency
+        )
@@ -1,5 +1,6 @@
 """Test fixtures for CDP API tests."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -68,16 +69,13 @@ def mock_contract():
 @pytest.fixture
 def mock_contract_result():
     """Create a mock contract deployment result."""
-    result = Mock()
-    result.contract_address = MOCK_CONTRACT_ADDRESS
-
-    transaction = Mock()
-    transaction.transaction_hash = MOCK_TX_HASH
-    transaction.transaction_link = f"{MOCK_EXPLORER_URL}/{MOCK_TX_HASH}"
-
-    result.transaction = transaction
-
-    return result
+    return SimpleNamespace(
+        contract_address=MOCK_CONTRACT_ADDRESS,
+        transaction=SimpleNamespace(
+            transaction_hash=MOCK_TX_HASH,
+            transaction_link=f"{MOCK_EXPLORER_URL}/{MOCK_TX_HASH}",
+        ),
+    )
 
 
 @pytest.fixture
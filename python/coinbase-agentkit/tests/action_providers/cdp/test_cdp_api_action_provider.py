@@ -10,6 +10,15 @@ from coinbase_agentkit.action_providers.cdp.cdp_api_action_provider import (
 )
 from coinbase_agentkit.network import Network
 
+SUPPORTED_NETWORKS = [
+    Network(protocol_family="evm", network_id="base-sepolia"),
+    Network(protocol_family="evm", network_id="ethereum-sepolia"),
+    Network(protocol_family="evm", network_id="base-mainnet"),
+    Network(protocol_family="evm", network_id="ethereum-mainnet"),
+    Network(protocol_family="svm", network_id="solana-devnet"),
+    Network(protocol_family="svm", network_id="solana-mainnet"),
+]
+
 
 def test_provider_initializes():
     """Test provider initializes correctly."""
@@ -20,33 +29,10 @@ def test_provider_initializes():
 
 
 @pytest.mark.usefixtures("mock_env")
-def test_supports_network():
+@pytest.mark.parametrize("network", SUPPORTED_NETWORKS, ids=lambda network: network.network_id)
+def test_supports_network(network):
     """Test network support."""
     with patch("cdp.CdpClient"):
         provider = cdp_api_action_provider()
 
-        assert (
-            provider.supports_network(Network(protocol_family="evm", network_id="base-sepolia"))
-            is True
-        )
-        assert (
-            provider.supports_network(Network(protocol_family="evm", network_id="ethereum-sepolia"))
-            is True
-        )
-        assert (
-            provider.supports_network(Network(protocol_family="evm", network_id="base-mainnet"))
-            is True
-        )
-        assert (
-            provider.supports_network(Network(protocol_family="evm", network_id="ethereum-mainnet"))
-            is True
-        )
-
-        assert (
-            provider.supports_network(Network(protocol_family="svm", network_id="solana-devnet"))
-            is True
-        )
-        assert (
-            provider.supports_network(Network(protocol_family="svm", network_id="solana-mainnet"))
-            is True
-        )
+        assert provider.supports_network(network) is True
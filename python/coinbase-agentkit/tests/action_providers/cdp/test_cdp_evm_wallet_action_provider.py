@@ -21,6 +21,11 @@ MOCK_WALLET_ADDRESS = "0x1234567890123456789012345678901234567890"
 MOCK_SWAP_TX_HASH = "0xswap789"
 MOCK_APPROVAL_TX_HASH = "0xapproval123"
 
+MOCK_BASE_MAINNET_NETWORK = Network(protocol_family="evm", network_id="base-mainnet")
+MOCK_BASE_SEPOLIA_NETWORK = Network(protocol_family="evm", network_id="base-sepolia")
+MOCK_ETHEREUM_MAINNET_NETWORK = Network(protocol_family="evm", network_id="ethereum-mainnet")
+MOCK_SOLANA_DEVNET_NETWORK = Network(protocol_family="svm", network_id="solana-devnet")
+
 
 @pytest.fixture
 def mock_cdp_client():
@@ -104,12 +109,10 @@ class TestCdpEvmWalletActionProvider:
     def test_supports_network(self, action_provider):
         """Test network support based on protocol family."""
         # Test EVM networks
-        evm_network = Network(protocol_family="evm", network_id="base-mainnet")
-        assert action_provider.supports_network(evm_network) is True
+        assert action_provider.supports_network(MOCK_BASE_MAINNET_NETWORK) is True
 
         # Test non-EVM networks
-        svm_network = Network(protocol_family="svm", network_id="solana-devnet")
-        assert action_provider.supports_network(svm_network) is False
+        assert action_provider.supports_network(MOCK_SOLANA_DEVNET_NETWORK) is False
 
     @patch("coinbase_agentkit.action_providers.cdp.swap_utils.get_token_details")
     @patch("asyncio.get_event_loop")
@@ -123,9 +126,7 @@ class TestCdpEvmWalletActionProvider:
     ):
         """Test get_swap_price on base-mainnet."""
         # Setup
-        mock_evm_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_evm_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_evm_wallet_provider.get_client.return_value = mock_cdp_client
 
         mock_get_token_details.return_value = {
@@ -174,9 +175,7 @@ class TestCdpEvmWalletActionProvider:
     ):
         """Test get_swap_price on ethereum-mainnet."""
         # Setup
-        mock_evm_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="ethereum-mainnet"
-        )
+        mock_evm_wallet_provider.get_network.return_value = MOCK_ETHEREUM_MAINNET_NETWORK
         mock_evm_wallet_provider.get_client.return_value = mock_cdp_client
         mock_evm_wallet_provider._get_cdp_sdk_network.return_value = "ethereum"
 
@@ -208,9 +207,7 @@ class TestCdpEvmWalletActionProvider:
     def test_get_swap_price_unsupported_network(self, action_provider, mock_evm_wallet_provider):
         """Test get_swap_price returns error for unsupported networks."""
         # Setup
-        mock_evm_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-sepolia"
-        )
+        mock_evm_wallet_provider.get_network.return_value = MOCK_BASE_SEPOLIA_NETWORK
 
         args = {"from_token": MOCK_ETH_ADDRESS, "to_token": MOCK_USDC_ADDRESS, "from_amount": "0.1"}
 
@@ -231,9 +228,7 @@ class TestCdpEvmWalletActionProvider:
     ):
         """Test get_swap_price handles API errors."""
         # Setup
-        mock_evm_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_evm_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_evm_wallet_provider.get_client.return_value = mock_cdp_client
 
         mock_get_token_details.return_value = {
@@ -269,9 +264,7 @@ class TestCdpEvmWalletActionProvider:
     ):
         """Test successful swap execution."""
         # Setup
-        mock_evm_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_evm_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_evm_wallet_provider.get_client.return_value = mock_cdp_client
         mock_evm_wallet_provider.wait_for_transaction_receipt.return_value = Mock(status="success")
 
@@ -330,9 +323,7 @@ class TestCdpEvmWalletActionProvider:
     def test_swap_unsupported_network(self, action_provider, mock_evm_wallet_provider):
         """Test swap returns error for unsupported networks."""
         # Setup
-        mock_evm_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-sepolia"
-        )
+        mock_evm_wallet_provider.get_network.return_value = MOCK_BASE_SEPOLIA_NETWORK
 
         args = {"from_token": MOCK_ETH_ADDRESS, "to_token": MOCK_USDC_ADDRESS, "from_amount": "0.1"}
 
@@ -359,9 +350,7 @@ class TestCdpEvmWalletActionProvider:
     ):
         """Test swap returns error when liquidity is not available."""
         # Setup
-        mock_evm_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_evm_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_evm_wallet_provider.get_client.return_value = mock_cdp_client
 
         mock_get_token_details.return_value = {
@@ -397,9 +386,7 @@ class TestCdpEvmWalletActionProvider:
     ):
         """Test swap returns error when balance is insufficient."""
         # Setup
-        mock_evm_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_evm_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_evm_wallet_provider.get_client.return_value = mock_cdp_client
 
         mock_get_token_details.return_value = {
@@ -446,9 +433,7 @@ class TestCdpEvmWalletActionProvider:
     ):
         """Test swap handles approval transaction when allowance is insufficient."""
         # Setup
-        mock_evm_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_evm_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_evm_wallet_provider.get_client.return_value = mock_cdp_client
         mock_evm_wallet_provider.wait_for_transaction_receipt.side_effect = [
             Mock(status="success"),  # Approval receipt
@@ -532,9 +517,7 @@ class TestCdpEvmWalletActionProvider:
     ):
         """Test swap handles execution errors."""
         # Setup
-        mock_evm_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_evm_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_evm_wallet_provider.get_client.return_value = mock_cdp_client
 
         mock_get_token_details.return_value = {
@@ -570,9 +553,7 @@ class TestCdpEvmWalletActionProvider:
     ):
         """Test swap handles transaction revert."""
         # Setup
-        mock_evm_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_evm_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_evm_wallet_provider.get_client.return_value = mock_cdp_client
         mock_evm_wallet_provider.wait_for_transaction_receipt.return_value = Mock(status="failed")
 
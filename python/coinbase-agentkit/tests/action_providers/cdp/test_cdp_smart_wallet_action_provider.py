@@ -22,6 +22,11 @@ MOCK_SWAP_USER_OP_HASH = "0xswap789"
 MOCK_APPROVAL_TX_HASH = "0xapproval123"
 MOCK_PAYMASTER_URL = "https://paymaster.example.com"
 
+MOCK_BASE_MAINNET_NETWORK = Network(protocol_family="evm", network_id="base-mainnet")
+MOCK_BASE_SEPOLIA_NETWORK = Network(protocol_family="evm", network_id="base-sepolia")
+MOCK_ETHEREUM_MAINNET_NETWORK = Network(protocol_family="evm", network_id="ethereum-mainnet")
+MOCK_SOLANA_DEVNET_NETWORK = Network(protocol_family="svm", network_id="solana-devnet")
+
 
 @pytest.fixture
 def mock_cdp_client():
@@ -112,12 +117,10 @@ class TestCdpSmartWalletActionProvider:
     def test_supports_network(self, action_provider):
         """Test network support returns True for all networks."""
         # Test EVM networks
-        evm_network = Network(protocol_family="evm", network_id="base-mainnet")
-        assert action_provider.supports_network(evm_network) is True
+        assert action_provider.supports_network(MOCK_BASE_MAINNET_NETWORK) is True
 
         # Test non-EVM networks
-        svm_network = Network(protocol_family="svm", network_id="solana-devnet")
-        assert action_provider.supports_network(svm_network) is True
+        assert action_provider.supports_network(MOCK_SOLANA_DEVNET_NETWORK) is True
 
     def test_get_cdp_sdk_network_mapping(self, action_provider):
         """Test CDP SDK network mapping."""
@@ -139,9 +142,7 @@ class TestCdpSmartWalletActionProvider:
     ):
         """Test get_swap_price on base-mainnet."""
         # Setup
-        mock_smart_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_smart_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_smart_wallet_provider.get_client.return_value = mock_cdp_client
 
         mock_get_token_details.return_value = {
@@ -190,9 +191,7 @@ class TestCdpSmartWalletActionProvider:
     ):
         """Test get_swap_price on base-sepolia."""
         # Setup
-        mock_smart_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-sepolia"
-        )
+        mock_smart_wallet_provider.get_network.return_value = MOCK_BASE_SEPOLIA_NETWORK
         mock_smart_wallet_provider.get_client.return_value = mock_cdp_client
 
         mock_get_token_details.return_value = {
@@ -223,9 +222,7 @@ class TestCdpSmartWalletActionProvider:
     def test_get_swap_price_unsupported_network(self, action_provider, mock_smart_wallet_provider):
         """Test get_swap_price returns error for unsupported networks."""
         # Setup
-        mock_smart_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="ethereum-mainnet"
-        )
+        mock_smart_wallet_provider.get_network.return_value = MOCK_ETHEREUM_MAINNET_NETWORK
 
         args = {"from_token": MOCK_ETH_ADDRESS, "to_token": MOCK_USDC_ADDRESS, "from_amount": "0.1"}
 
@@ -246,9 +243,7 @@ class TestCdpSmartWalletActionProvider:
     ):
         """Test get_swap_price handles API errors."""
         # Setup
-        mock_smart_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_smart_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_smart_wallet_provider.get_client.return_value = mock_cdp_client
 
         mock_get_token_details.return_value = {
@@ -274,9 +269,7 @@ class TestCdpSmartWalletActionProvider:
         """Test swap returns error when owner is missing."""
         # Setup mock wallet provider without _owner attribute
         mock_wallet_provider = Mock()
-        mock_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         # Don't set _owner attribute
         del mock_wallet_provider._owner
 
@@ -304,9 +297,7 @@ class TestCdpSmartWalletActionProvider:
     ):
         """Test successful swap execution."""
         # Setup
-        mock_smart_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_smart_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_smart_wallet_provider.get_client.return_value = mock_cdp_client
         mock_smart_wallet_provider._get_smart_account.return_value = mock_smart_account
 
@@ -369,9 +360,7 @@ class TestCdpSmartWalletActionProvider:
     def test_swap_unsupported_network(self, action_provider, mock_smart_wallet_provider):
         """Test swap returns error for unsupported networks."""
         # Setup
-        mock_smart_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="ethereum-mainnet"
-        )
+        mock_smart_wallet_provider.get_network.return_value = MOCK_ETHEREUM_MAINNET_NETWORK
 
         args = {"from_token": MOCK_ETH_ADDRESS, "to_token": MOCK_USDC_ADDRESS, "from_amount": "0.1"}
 
@@ -398,9 +387,7 @@ class TestCdpSmartWalletActionProvider:
     ):
         """Test swap returns error when liquidity is not available."""
         # Setup
-        mock_smart_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_smart_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_smart_wallet_provider.get_client.return_value = mock_cdp_client
         mock_smart_wallet_provider._get_smart_account.return_value = mock_smart_account
 
@@ -436,9 +423,7 @@ class TestCdpSmartWalletActionProvider:
     ):
         """Test swap returns error when balance is insufficient."""
         # Setup
-        mock_smart_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_smart_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_smart_wallet_provider.get_client.return_value = mock_cdp_client
         mock_smart_wallet_provider._get_smart_account.return_value = mock_smart_account
 
@@ -484,9 +469,7 @@ class TestCdpSmartWalletActionProvider:
     ):
         """Test swap handles approval transaction when allowance is insufficient."""
         # Setup
-        mock_smart_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_smart_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_smart_wallet_provider.get_client.return_value = mock_cdp_client
         mock_smart_wallet_provider._get_smart_account.return_value = mock_smart_account
         mock_smart_wallet_provider.send_transaction.return_value = MOCK_APPROVAL_TX_HASH
@@ -572,9 +555,7 @@ class TestCdpSmartWalletActionProvider:
     ):
         """Test swap handles execution errors."""
         # Setup
-        mock_smart_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_smart_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_smart_wallet_provider.get_client.return_value = mock_cdp_client
         mock_smart_wallet_provider._get_smart_account.return_value = mock_smart_account
 
@@ -610,9 +591,7 @@ class TestCdpSmartWalletActionProvider:
     ):
         """Test swap handles user operation revert."""
         # Setup
-        mock_smart_wallet_provider.get_network.return_value = Network(
-            protocol_family="evm", network_id="base-mainnet"
-        )
+        mock_smart_wallet_provider.get_network.return_value = MOCK_BASE_MAINNET_NETWORK
         mock_smart_wallet_provider.get_client.return_value = mock_cdp_client
         mock_smart_wallet_provider._get_smart_account.return_value = mock_smart_account
 
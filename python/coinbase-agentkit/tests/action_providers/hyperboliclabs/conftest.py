@@ -1,11 +1,19 @@
 """Common test fixtures for Hyperbolic services."""
 
 import os
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def mock_analytics(monkeypatch):
+    """Stop action invocations from sending analytics events."""
+    monkeypatch.setattr(
+        "coinbase_agentkit.action_providers.action_decorator.send_analytics_event", Mock()
+    )
+
+
 @pytest.fixture
 def api_key() -> str:
     """Get API key for testing.
@@ -4,9 +4,6 @@ from unittest.mock import patch
 
 import pytest
 
-from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.action_provider import (
-    MarketplaceActionProvider,
-)
 from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.types import (
     AvailableInstance,
     AvailableInstancesResponse,
@@ -73,19 +70,10 @@ def mock_api_response():
     return AvailableInstancesResponse(instances=[instance1, instance2])
 
 
-@pytest.fixture
-def provider(mock_api_key):
-    """Create HyperbolicMarketplaceActionProvider instance with test API key."""
-    return MarketplaceActionProvider(api_key=mock_api_key)
-
-
 def test_get_available_gpus_success(provider, mock_api_response):
     """Test successful get_available_gpus action."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(
-            provider.marketplace, "get_available_instances", return_value=mock_api_response
-        ),
+    with patch.object(
+        provider.marketplace, "get_available_instances", return_value=mock_api_response
     ):
         result = provider.get_available_gpus({})
 
@@ -112,21 +100,15 @@ def test_get_available_gpus_empty_response(provider):
     """Test get_available_gpus action with empty response."""
     empty_response = AvailableInstancesResponse(instances=[])
 
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(provider.marketplace, "get_available_instances", return_value=empty_response),
-    ):
+    with patch.object(provider.marketplace, "get_available_instances", return_value=empty_response):
         result = provider.get_available_gpus({})
         assert "No available GPU instances found." in result
 
 
 def test_get_available_gpus_api_error(provider):
     """Test get_available_gpus action with API error."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(
-            provider.marketplace, "get_available_instances", side_effect=Exception("API Error")
-        ),
+    with patch.object(
+        provider.marketplace, "get_available_instances", side_effect=Exception("API Error")
     ):
         result = provider.get_available_gpus({})
         assert "Error: GPU retrieval: API Error" in result
@@ -4,9 +4,6 @@ from unittest.mock import patch
 
 import pytest
 
-from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.action_provider import (
-    MarketplaceActionProvider,
-)
 from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.types import (
     AvailableInstance,
     AvailableInstancesResponse,
@@ -108,18 +105,9 @@ def mock_response():
     return AvailableInstancesResponse(instances=[instance1, instance2, instance3, instance4])
 
 
-@pytest.fixture
-def provider(mock_api_key):
-    """Create HyperbolicMarketplaceActionProvider instance with test API key."""
-    return MarketplaceActionProvider(api_key=mock_api_key)
-
-
 def test_get_available_gpus_types_success(provider, mock_response):
     """Test successful get_available_gpus_types action."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(provider.marketplace, "get_available_instances", return_value=mock_response),
-    ):
+    with patch.object(provider.marketplace, "get_available_instances", return_value=mock_response):
         result = provider.get_available_gpus_types({})
 
         assert "Available GPU Types:" in result
@@ -132,21 +120,15 @@ def test_get_available_gpus_types_empty_response(provider):
     """Test get_available_gpus_types action with empty response."""
     empty_response = AvailableInstancesResponse(instances=[])
 
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(provider.marketplace, "get_available_instances", return_value=empty_response),
-    ):
+    with patch.object(provider.marketplace, "get_available_instances", return_value=empty_response):
         result = provider.get_available_gpus_types({})
         assert "No available GPU instances found." in result
 
 
 def test_get_available_gpus_types_api_error(provider):
     """Test get_available_gpus_types action with API error."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(
-            provider.marketplace, "get_available_instances", side_effect=Exception("API Error")
-        ),
+    with patch.object(
+        provider.marketplace, "get_available_instances", side_effect=Exception("API Error")
     ):
         result = provider.get_available_gpus_types({})
         assert "Error: GPU types retrieval: API Error" in result
@@ -154,10 +136,7 @@ def test_get_available_gpus_types_api_error(provider):
 
 def test_get_available_gpus_by_type_success(provider, mock_response):
     """Test successful get_available_gpus_by_type action."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(provider.marketplace, "get_available_instances", return_value=mock_response),
-    ):
+    with patch.object(provider.marketplace, "get_available_instances", return_value=mock_response):
         result = provider.get_available_gpus_by_type({"gpu_model": "NVIDIA-GeForce-RTX-3070"})
 
         assert "Available NVIDIA-GeForce-RTX-3070 GPU Options:" in result
@@ -191,10 +170,7 @@ def test_get_available_gpus_by_type_success(provider, mock_response):
 
 def test_get_available_gpus_by_type_not_found(provider, mock_response):
     """Test get_available_gpus_by_type action with GPU model not found."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(provider.marketplace, "get_available_instances", return_value=mock_response),
-    ):
+    with patch.object(provider.marketplace, "get_available_instances", return_value=mock_response):
         result = provider.get_available_gpus_by_type({"gpu_model": "NVIDIA-H100"})
         assert "No available GPU instances with the model 'NVIDIA-H100' found." in result
 
@@ -203,21 +179,15 @@ def test_get_available_gpus_by_type_empty_response(provider):
     """Test get_available_gpus_by_type action with empty response."""
     empty_response = AvailableInstancesResponse(instances=[])
 
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(provider.marketplace, "get_available_instances", return_value=empty_response),
-    ):
+    with patch.object(provider.marketplace, "get_available_instances", return_value=empty_response):
         result = provider.get_available_gpus_by_type({"gpu_model": "NVIDIA-A100"})
         assert "No available GPU instances found." in result
 
 
 def test_get_available_gpus_by_type_api_error(provider):
     """Test get_available_gpus_by_type action with API error."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(
-            provider.marketplace, "get_available_instances", side_effect=Exception("API Error")
-        ),
+    with patch.object(
+        provider.marketplace, "get_available_instances", side_effect=Exception("API Error")
     ):
         result = provider.get_available_gpus_by_type({"gpu_model": "NVIDIA-A100"})
         assert "Error: GPU retrieval: API Error" in result
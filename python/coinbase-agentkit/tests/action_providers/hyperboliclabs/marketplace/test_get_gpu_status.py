@@ -4,9 +4,6 @@ from unittest.mock import patch
 
 import pytest
 
-from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.action_provider import (
-    MarketplaceActionProvider,
-)
 from coinbase_agentkit.action_providers.hyperboliclabs.marketplace.types import (
     CpuHardware,
     GpuHardware,
@@ -135,21 +132,12 @@ def mock_rented_instances_without_ssh():
     return RentedInstancesResponse(instances=[rental_without_ssh])
 
 
-@pytest.fixture
-def provider(mock_api_key):
-    """Create HyperbolicMarketplaceActionProvider instance with test API key."""
-    return MarketplaceActionProvider(api_key=mock_api_key)
-
-
 def test_get_gpu_status_with_ssh_command(provider, mock_rented_instances_with_ssh_command):
     """Test get_gpu_status when instances have ssh_command."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(
-            provider.marketplace,
-            "get_rented_instances",
-            return_value=mock_rented_instances_with_ssh_command,
-        ),
+    with patch.object(
+        provider.marketplace,
+        "get_rented_instances",
+        return_value=mock_rented_instances_with_ssh_command,
     ):
         result = provider.get_gpu_status({})
 
@@ -171,13 +159,10 @@ def test_get_gpu_status_with_ssh_command(provider, mock_rented_instances_with_ss
 
 def test_get_gpu_status_with_ssh_access(provider, mock_rented_instances_with_ssh_access):
     """Test get_gpu_status when instances have ssh_access but no ssh_command."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(
-            provider.marketplace,
-            "get_rented_instances",
-            return_value=mock_rented_instances_with_ssh_access,
-        ),
+    with patch.object(
+        provider.marketplace,
+        "get_rented_instances",
+        return_value=mock_rented_instances_with_ssh_access,
     ):
         result = provider.get_gpu_status({})
 
@@ -199,13 +184,10 @@ def test_get_gpu_status_with_ssh_access(provider, mock_rented_instances_with_ssh
 
 def test_get_gpu_status_without_ssh(provider, mock_rented_instances_without_ssh):
     """Test get_gpu_status when instances have no SSH information."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(
-            provider.marketplace,
-            "get_rented_instances",
-            return_value=mock_rented_instances_without_ssh,
-        ),
+    with patch.object(
+        provider.marketplace,
+        "get_rented_instances",
+        return_value=mock_rented_instances_without_ssh,
     ):
         result = provider.get_gpu_status({})
 
@@ -230,21 +212,15 @@ def test_get_gpu_status_empty_response(provider):
     """Test get_gpu_status with no rented instances."""
     empty_response = RentedInstancesResponse(instances=[])
 
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(provider.marketplace, "get_rented_instances", return_value=empty_response),
-    ):
+    with patch.object(provider.marketplace, "get_rented_instances", return_value=empty_response):
         result = provider.get_gpu_status({})
         assert "No rented GPU instances found." in result
 
 
 def test_get_gpu_status_api_error(provider):
     """Test get_gpu_status with API error."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(
-            provider.marketplace, "get_rented_instances", side_effect=Exception("API Error")
-        ),
+    with patch.object(
+        provider.marketplace, "get_rented_instances", side_effect=Exception("API Error")
     ):
         result = provider.get_gpu_status({})
         assert "Error: GPU status retrieval: API Error" in result
@@ -19,10 +19,7 @@ def test_rent_compute_success(provider):
     """Test successful compute rental."""
     mock_response = RentInstanceResponse(status="success", instance_name="i-123456")
 
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(provider.marketplace, "rent_instance", return_value=mock_response),
-    ):
+    with patch.object(provider.marketplace, "rent_instance", return_value=mock_response):
         result = provider.rent_compute(
             {"cluster_name": "us-east-1", "node_name": "node-789", "gpu_count": "2"}
         )
@@ -41,10 +38,7 @@ def test_rent_compute_success(provider):
 
 def test_rent_compute_api_error(provider):
     """Test compute rental with API error."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(provider.marketplace, "rent_instance", side_effect=Exception("API Error")),
-    ):
+    with patch.object(provider.marketplace, "rent_instance", side_effect=Exception("API Error")):
         result = provider.rent_compute(
             {"cluster_name": "us-east-1", "node_name": "node-789", "gpu_count": "2"}
         )
@@ -53,10 +47,7 @@ def test_rent_compute_api_error(provider):
 
 def test_rent_compute_missing_fields(provider):
     """Test compute rental with missing required fields."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch("requests.post", return_value=Mock()),
-    ):
+    with patch("requests.post", return_value=Mock()):
         with pytest.raises(ValidationError, match="Field required"):
             provider.rent_compute({"node_name": "node-789", "gpu_count": "2"})
 
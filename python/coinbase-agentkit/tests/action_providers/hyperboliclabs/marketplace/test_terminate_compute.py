@@ -15,10 +15,7 @@ def test_terminate_compute_success(provider):
         status="success", message="Instance terminated successfully"
     )
 
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(provider.marketplace, "terminate_instance", return_value=mock_response),
-    ):
+    with patch.object(provider.marketplace, "terminate_instance", return_value=mock_response):
         result = provider.terminate_compute({"id": "i-123456"})
 
         assert '"status": "success"' in result
@@ -33,11 +30,8 @@ def test_terminate_compute_success(provider):
 
 def test_terminate_compute_api_error(provider):
     """Test compute termination with API error."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(
-            provider.marketplace, "terminate_instance", side_effect=Exception("API Error")
-        ),
+    with patch.object(
+        provider.marketplace, "terminate_instance", side_effect=Exception("API Error")
     ):
         result = provider.terminate_compute({"id": "i-123456"})
         assert "Error: Compute termination: API Error" in result
@@ -45,10 +39,7 @@ def test_terminate_compute_api_error(provider):
 
 def test_terminate_compute_missing_instance_id(provider):
     """Test compute termination with missing instance ID."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch("requests.post", return_value=Mock()),
-    ):
+    with patch("requests.post", return_value=Mock()):
         with pytest.raises(Exception) as exc_info:
             provider.terminate_compute({})
         assert "Field required" in str(exc_info.value)
@@ -13,10 +13,7 @@ def test_link_wallet_address_success(provider):
     """Test successful wallet address linking."""
     mock_response = WalletLinkResponse(success=True, message="Wallet address linked successfully")
 
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(provider.settings, "link_wallet", return_value=mock_response),
-    ):
+    with patch.object(provider.settings, "link_wallet", return_value=mock_response):
         result = provider.link_wallet_address({"address": VALID_ETH_ADDRESS})
 
         assert '"success": true' in result
@@ -37,28 +34,19 @@ def test_link_wallet_address_success(provider):
 
 def test_link_wallet_address_api_error(provider):
     """Test wallet address linking with API error."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-        patch.object(provider.settings, "link_wallet", side_effect=Exception("API Error")),
-    ):
+    with patch.object(provider.settings, "link_wallet", side_effect=Exception("API Error")):
         result = provider.link_wallet_address({"address": VALID_ETH_ADDRESS})
         assert "Error: Wallet linking: API Error" in result
 
 
 def test_link_wallet_address_missing_address(provider):
     """Test wallet address linking with missing address."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-    ):
-        with pytest.raises(Exception) as exc_info:
-            provider.link_wallet_address({})
-        assert "Field required" in str(exc_info.value)
+    with pytest.raises(Exception) as exc_info:
+        provider.link_wallet_address({})
+    assert "Field required" in str(exc_info.value)
 
 
 def test_link_wallet_address_empty_address(provider):
     """Test wallet address linking with empty address."""
-    with (
-        patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"),
-    ):
-        result = provider.link_wallet_address({"address": ""})
-        assert "Error" in result
+    result = provider.link_wallet_address({"address": ""})
+    assert "Error" in result
@@ -15,6 +15,12 @@ from coinbase_agentkit.network import Network
 MOCK_PROJECT_ID = "test-project-id"
 MOCK_ADDRESS = "0x123"
 
+MOCK_BASE_NETWORK = Network(chain_id="1", protocol_family="evm", network_id="base-mainnet")
+MOCK_UNSUPPORTED_NETWORK = Network(
+    chain_id="1", protocol_family="evm", network_id="unsupported-network"
+)
+MOCK_MISSING_ID_NETWORK = Network(chain_id="1", protocol_family="evm", network_id=None)
+
 
 def parse_url_params(url: str) -> dict:
     """Parse URL parameters into a dictionary.
@@ -40,9 +46,7 @@ def test_get_onramp_buy_url_schema():
 def test_get_onramp_buy_url_success(mock_wallet):
     """Test successful get_onramp_buy_url call."""
     mock_wallet.get_address.return_value = MOCK_ADDRESS
-    mock_wallet.get_network.return_value = Network(
-        chain_id="1", protocol_family="evm", network_id="base-mainnet"
-    )
+    mock_wallet.get_network.return_value = MOCK_BASE_NETWORK
 
     provider = onramp_action_provider(MOCK_PROJECT_ID)
     result = provider.get_onramp_buy_url(mock_wallet, {})
@@ -66,9 +70,7 @@ def test_get_onramp_buy_url_success(mock_wallet):
 
 def test_get_onramp_buy_url_unsupported_network(mock_wallet):
     """Test get_onramp_buy_url with unsupported network."""
-    mock_wallet.get_network.return_value = Network(
-        chain_id="1", protocol_family="evm", network_id="unsupported-network"
-    )
+    mock_wallet.get_network.return_value = MOCK_UNSUPPORTED_NETWORK
     provider = onramp_action_provider(MOCK_PROJECT_ID)
 
     with pytest.raises(
@@ -80,23 +82,24 @@ def test_get_onramp_buy_url_unsupported_network(mock_wallet):
 
 def test_get_onramp_buy_url_missing_network_id(mock_wallet):
     """Test get_onramp_buy_url with missing network ID."""
-    mock_wallet.get_network.return_value = Network(
-        chain_id="1", protocol_family="evm", network_id=None
-    )
+    mock_wallet.get_network.return_value = MOCK_MISSING_ID_NETWORK
     provider = onramp_action_provider(MOCK_PROJECT_ID)
 
     with pytest.raises(ValueError, match="Network ID is not set"):
         provider.get_onramp_buy_url(mock_wallet, {})
 
 
-def test_supports_network():
+@pytest.mark.parametrize(
+    ("network", "expected"),
+    [
+        (MOCK_BASE_NETWORK, True),
+        (Network(chain_id="1", protocol_family="solana", network_id="solana-mainnet"), False),
+        (Network(chain_id="1", protocol_family="other-protocol-family", network_id="test"), False),
+    ],
+    ids=["evm", "solana", "other"],
+)
+def test_supports_network(network, expected):
     """Test network support based on protocol family."""
     provider = onramp_action_provider(MOCK_PROJECT_ID)
 
-    # Test EVM network support
-    evm_network = Network(chain_id="1", protocol_family="evm", network_id="base-mainnet")
-    assert provider.supports_network(evm_network) is True
-
-    # Test non-EVM network
-    non_evm_network = Network(chain_id="1", protocol_family="solana", network_id="solana-mainnet")
-    assert provider.supports_network(non_evm_network) is False
+    assert provider.supports_network(network) is expected
@@ -26,7 +26,7 @@ def mock_wallet_provider():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def wallet_action_provider():
     """Create a WalletActionProvider instance."""
     return WalletActionProvider()
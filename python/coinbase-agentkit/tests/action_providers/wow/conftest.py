@@ -0,0 +1,58 @@
+"""Fixtures for WOW action provider tests."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_CHAIN_ID = "84532"
+MOCK_WALLET_ADDRESS = "0x9876543210987654321098765432109876543210"
+MOCK_ETH_QUOTE = "1000000000000000000"
+MOCK_TOKEN_QUOTE = "1000000000000000000"
+MOCK_TX_HASH = "0xabcdef1234567890"
+MOCK_RECEIPT = {"status": 1, "transactionHash": MOCK_TX_HASH}
+
+# Amounts that are not a whole number of wei, including non-ASCII digits
+INVALID_WEI_AMOUNTS = ["1.5", "", "-1", " 1", "1 ", "1e18", "\uff11", "\u00b2"]
+
+
+@pytest.fixture
+def wow_mocks():
+    """Patch web3, the wallet provider and the quote helpers used by WowActionProvider.
+
+    Tests override only the attribute they exercise, e.g. ``has_graduated.return_value``
+    or ``wallet.send_transaction.side_effect``.
+    """
+    with (
+        patch("web3.eth.Eth.contract") as mock_contract,
+        patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
+        patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
+        patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
+        patch(
+            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_buy_quote",
+            return_value=MOCK_TOKEN_QUOTE,
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_sell_quote",
+            return_value=MOCK_ETH_QUOTE,
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
+            return_value=False,
+        ) as mock_has_graduated,
+    ):
+        mock_contract.return_value.encode_abi.return_value = "0xencoded"
+        mock_web3.to_checksum_address.side_effect = lambda x: x
+        mock_web3.return_value.eth.contract = mock_contract
+        mock_wallet.get_address.return_value = MOCK_WALLET_ADDRESS
+        mock_wallet.get_network.return_value.network_id = MOCK_NETWORK_ID
+        mock_wallet.get_network.return_value.chain_id = MOCK_CHAIN_ID
+        mock_wallet.send_transaction.return_value = MOCK_TX_HASH
+        mock_wallet.wait_for_transaction_receipt.return_value = MOCK_RECEIPT
+
+        yield SimpleNamespace(
+            contract=mock_contract,
+            wallet=mock_wallet,
+            has_graduated=mock_has_graduated,
+        )
@@ -1,6 +1,6 @@
 """Tests for WOW sell token action."""
 
-from unittest.mock import patch
+import math
 
 import pytest
 from pydantic_core import ValidationError
@@ -9,13 +9,12 @@ from coinbase_agentkit.action_providers.wow.constants import WOW_ABI
 from coinbase_agentkit.action_providers.wow.schemas import WowSellTokenSchema
 from coinbase_agentkit.action_providers.wow.wow_action_provider import WowActionProvider
 
+from .conftest import INVALID_WEI_AMOUNTS, MOCK_ETH_QUOTE, MOCK_TX_HASH, MOCK_WALLET_ADDRESS
+
 MOCK_CONTRACT_ADDRESS = "0x1234567890123456789012345678901234567890"
 MOCK_AMOUNT_TOKENS = "100000000000000"
-MOCK_NETWORK_ID = "base-sepolia"
-MOCK_WALLET_ADDRESS = "0x9876543210987654321098765432109876543210"
-MOCK_ETH_QUOTE = "1000000000000000000"
-MOCK_TX_HASH = "0xabcdef1234567890"
-MOCK_RECEIPT = {"status": 1, "transactionHash": MOCK_TX_HASH}
+MOCK_AMOUNT_TOKENS_INT = int(MOCK_AMOUNT_TOKENS)
+MOCK_MIN_ETH = math.floor(float(MOCK_ETH_QUOTE) * 0.98)
 
 
 def test_sell_token_input_model_valid():
@@ -39,176 +38,90 @@ def test_sell_token_input_model_invalid_address():
     assert "Invalid Ethereum address" in str(exc_info.value)
 
 
-def test_sell_token_input_model_invalid_wei():
+@pytest.mark.parametrize("amount", INVALID_WEI_AMOUNTS)
+def test_sell_token_input_model_invalid_wei(amount):
     """Test that WowSellTokenInput rejects invalid wei amounts."""
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValidationError, match="Amount must be a whole number of wei"):
         WowSellTokenSchema(
             contract_address=MOCK_CONTRACT_ADDRESS,
-            amount_tokens_in_wei="1.5",
+            amount_tokens_in_wei=amount,
         )
 
 
+def test_sell_token_json_schema_amount_pattern():
+    """Test that the JSON schema tells the model the amount must be a whole number of wei."""
+    schema = WowSellTokenSchema.model_json_schema()
+    assert schema["properties"]["amount_tokens_in_wei"]["pattern"] == r"^\d+$"
+
+
 def test_sell_token_input_model_missing_params():
     """Test that WowSellTokenInput raises error when params are missing."""
     with pytest.raises(ValidationError):
         WowSellTokenSchema()
 
 
-def test_sell_token_success():
-    """Test successful token sale with valid parameters."""
-    with (
-        patch("web3.eth.Eth.contract") as mock_contract,
-        patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
-        patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
-        patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_sell_quote",
-            return_value=MOCK_ETH_QUOTE,
-        ),
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
-            return_value=False,
-        ),
-    ):
-        mock_contract.return_value.encode_abi.return_value = "0xencoded"
-        mock_web3.to_checksum_address.side_effect = lambda x: x
-        mock_web3.return_value.eth.contract = mock_contract
-        mock_wallet.get_address.return_value = MOCK_WALLET_ADDRESS
-        mock_wallet.get_network.return_value.network_id = MOCK_NETWORK_ID
-        mock_wallet.send_transaction.return_value = MOCK_TX_HASH
-        mock_wallet.wait_for_transaction_receipt.return_value = MOCK_RECEIPT
-
-        provider = WowActionProvider()
-        args = {
-            "contract_address": MOCK_CONTRACT_ADDRESS,
-            "amount_tokens_in_wei": MOCK_AMOUNT_TOKENS,
-        }
-        response = provider.sell_token(mock_wallet, args)
-
-        expected_response = f"Sold WoW ERC20 memecoin with transaction hash: {MOCK_TX_HASH}"
-        assert response == expected_response
-
-        mock_contract.assert_called_once_with(
-            address=MOCK_CONTRACT_ADDRESS,
-            abi=WOW_ABI,
-        )
-
-        min_eth = int(int(MOCK_ETH_QUOTE) * 0.98)
-
-        mock_contract.return_value.encode_abi.assert_called_once_with(
-            "sell",
-            [
-                int(MOCK_AMOUNT_TOKENS),
-                MOCK_WALLET_ADDRESS,
-                "0x0000000000000000000000000000000000000000",
-                "",
-                0,
-                min_eth,
-                0,
-            ],
-        )
+@pytest.mark.parametrize(
+    ("has_graduated", "expected_market_type"),
+    [(False, 0), (True, 1)],
+    ids=["bonding_curve", "graduated_pool"],
+)
+def test_sell_token_success(wow_mocks, has_graduated, expected_market_type):
+    """Test successful token sale on the bonding curve and on a graduated pool."""
+    wow_mocks.has_graduated.return_value = has_graduated
+
+    provider = WowActionProvider()
+    args = {
+        "contract_address": MOCK_CONTRACT_ADDRESS,
+        "amount_tokens_in_wei": MOCK_AMOUNT_TOKENS,
+    }
+    response = provider.sell_token(wow_mocks.wallet, args)
+
+    expected_response = f"Sold WoW ERC20 memecoin with transaction hash: {MOCK_TX_HASH}"
+    assert response == expected_response
+
+    wow_mocks.contract.assert_called_once_with(
+        address=MOCK_CONTRACT_ADDRESS,
+        abi=WOW_ABI,
+    )
 
-        mock_wallet.send_transaction.assert_called_once_with(
-            {
-                "to": MOCK_CONTRACT_ADDRESS,
-                "data": "0xencoded",
-            }
-        )
+    wow_mocks.contract.return_value.encode_abi.assert_called_once_with(
+        "sell",
+        [
+            MOCK_AMOUNT_TOKENS_INT,
+            MOCK_WALLET_ADDRESS,
+            "0x0000000000000000000000000000000000000000",
+            "",
+            expected_market_type,
+            MOCK_MIN_ETH,
+            0,
+        ],
+    )
 
-        mock_wallet.wait_for_transaction_receipt.assert_called_once_with(MOCK_TX_HASH)
-
-
-def test_sell_token_graduated_pool():
-    """Test token sale with graduated pool."""
-    with (
-        patch("web3.eth.Eth.contract") as mock_contract,
-        patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
-        patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
-        patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_sell_quote",
-            return_value=MOCK_ETH_QUOTE,
-        ),
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
-            return_value=True,
-        ),
-    ):
-        mock_contract.return_value.encode_abi.return_value = "0xencoded"
-        mock_web3.to_checksum_address.side_effect = lambda x: x
-        mock_web3.return_value.eth.contract = mock_contract
-        mock_wallet.get_address.return_value = MOCK_WALLET_ADDRESS
-        mock_wallet.get_network.return_value.network_id = MOCK_NETWORK_ID
-        mock_wallet.send_transaction.return_value = MOCK_TX_HASH
-        mock_wallet.wait_for_transaction_receipt.return_value = MOCK_RECEIPT
-
-        provider = WowActionProvider()
-        args = {
-            "contract_address": MOCK_CONTRACT_ADDRESS,
-            "amount_tokens_in_wei": MOCK_AMOUNT_TOKENS,
+    wow_mocks.wallet.send_transaction.assert_called_once_with(
+        {
+            "to": MOCK_CONTRACT_ADDRESS,
+            "data": "0xencoded",
         }
-        response = provider.sell_token(mock_wallet, args)
-
-        expected_response = f"Sold WoW ERC20 memecoin with transaction hash: {MOCK_TX_HASH}"
-        assert response == expected_response
-
-        min_eth = int(int(MOCK_ETH_QUOTE) * 0.98)
-
-        mock_contract.return_value.encode_abi.assert_called_once_with(
-            "sell",
-            [
-                int(MOCK_AMOUNT_TOKENS),
-                MOCK_WALLET_ADDRESS,
-                "0x0000000000000000000000000000000000000000",
-                "",
-                1,
-                min_eth,
-                0,
-            ],
-        )
+    )
 
-        mock_wallet.send_transaction.assert_called_once_with(
-            {
-                "to": MOCK_CONTRACT_ADDRESS,
-                "data": "0xencoded",
-            }
-        )
+    wow_mocks.wallet.wait_for_transaction_receipt.assert_called_once_with(MOCK_TX_HASH)
 
 
-def test_sell_token_error():
+def test_sell_token_error(wow_mocks):
     """Test sell_token when error occurs."""
-    with (
-        patch("web3.eth.Eth.contract") as mock_contract,
-        patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
-        patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
-        patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_sell_quote",
-            return_value=MOCK_ETH_QUOTE,
-        ),
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
-            return_value=False,
-        ),
-    ):
-        mock_contract.return_value.encode_abi.return_value = "0xencoded"
-        mock_web3.to_checksum_address.side_effect = lambda x: x
-        mock_web3.return_value.eth.contract = mock_contract
-        mock_wallet.get_address.return_value = MOCK_WALLET_ADDRESS
-        mock_wallet.get_network.return_value.network_id = MOCK_NETWORK_ID
-        mock_wallet.send_transaction.side_effect = Exception("Transaction failed")
-
-        provider = WowActionProvider()
-        args = {
-            "contract_address": MOCK_CONTRACT_ADDRESS,
-            "amount_tokens_in_wei": MOCK_AMOUNT_TOKENS,
-        }
-        response = provider.sell_token(mock_wallet, args)
+    wow_mocks.wallet.send_transaction.side_effect = Exception("Transaction failed")
 
-        expected_response = "Error selling Zora Wow ERC20 memecoin: Transaction failed"
-        assert response == expected_response
+    provider = WowActionProvider()
+    args = {
+        "contract_address": MOCK_CONTRACT_ADDRESS,
+        "amount_tokens_in_wei": MOCK_AMOUNT_TOKENS,
+    }
+    response = provider.sell_token(wow_mocks.wallet, args)
 
-        mock_contract.assert_called_once_with(
-            address=MOCK_CONTRACT_ADDRESS,
-            abi=WOW_ABI,
-        )
+    expected_response = "Error selling Zora Wow ERC20 memecoin: Transaction failed"
+    assert response == expected_response
+
+    wow_mocks.contract.assert_called_once_with(
+        address=MOCK_CONTRACT_ADDRESS,
+        abi=WOW_ABI,
+    )
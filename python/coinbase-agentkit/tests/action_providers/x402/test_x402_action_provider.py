@@ -26,36 +26,36 @@ from .conftest import (
 # =========================================================
 
 
-def test_http_request_schema_valid():
+@pytest.mark.parametrize(
+    "input_data",
+    [
+        {"url": MOCK_URL},
+        {"url": MOCK_URL, "method": "GET"},
+        {"url": MOCK_URL, "method": "POST", "headers": {"Accept": "application/json"}},
+        {"url": MOCK_URL, "method": "PUT", "headers": {}, "body": {"key": "value"}},
+    ],
+    ids=["minimal", "with_method", "with_headers", "with_body"],
+)
+def test_http_request_schema_valid(input_data):
     """Test that the HttpRequestSchema validates correctly."""
-    valid_inputs = [
-        {"url": MOCK_URL},  # Minimal
-        {"url": MOCK_URL, "method": "GET"},  # With method
-        {
-            "url": MOCK_URL,
-            "method": "POST",
-            "headers": {"Accept": "application/json"},
-        },  # With headers
-        {"url": MOCK_URL, "method": "PUT", "headers": {}, "body": {"key": "value"}},  # With body
-    ]
-
-    for input_data in valid_inputs:
-        schema = HttpRequestSchema(**input_data)
-        assert schema.url == MOCK_URL
-        if "method" in input_data:
-            assert schema.method == input_data["method"]
+    schema = HttpRequestSchema(**input_data)
+    assert schema.url == MOCK_URL
+    if "method" in input_data:
+        assert schema.method == input_data["method"]
 
 
-def test_http_request_schema_invalid():
+@pytest.mark.parametrize(
+    "input_data",
+    [
+        {},
+        {"url": MOCK_URL, "method": "INVALID"},
+    ],
+    ids=["missing_url", "invalid_method"],
+)
+def test_http_request_schema_invalid(input_data):
     """Test that the HttpRequestSchema fails on invalid input."""
-    invalid_inputs = [
-        {},  # Missing required url
-        {"url": MOCK_URL, "method": "INVALID"},  # Invalid method
-    ]
-
-    for input_data in invalid_inputs:
-        with pytest.raises(ValidationError):
-            HttpRequestSchema(**input_data)
+    with pytest.raises(ValidationError):
+        HttpRequestSchema(**input_data)
 
 
 def test_retry_schema_valid():
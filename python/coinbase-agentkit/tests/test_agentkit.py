@@ -0,0 +1,67 @@
+"""Tests for AgentKit."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit import AgentKit, AgentKitConfig
+from coinbase_agentkit.action_providers import Action, ActionProvider
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import WalletProvider
+
+MOCK_NETWORK = Network(protocol_family="evm", chain_id="84532", network_id="base-sepolia")
+
+
+def _mock_action_provider(supports_all_networks: bool, supports_network: bool) -> Mock:
+    """Create a mock action provider exposing a single action."""
+    provider = Mock(spec=ActionProvider)
+    provider.SUPPORTS_ALL_NETWORKS = supports_all_networks
+    provider.supports_network.return_value = supports_network
+    provider.get_actions.return_value = [
+        Action(name="mock_action", description="A mock action", invoke=Mock())
+    ]
+    return provider
+
+
+@pytest.fixture
+def mock_wallet_provider():
+    """Create a mock wallet provider for testing."""
+    mock = Mock(spec=WalletProvider)
+    mock.get_network.return_value = MOCK_NETWORK
+    return mock
+
+
+def test_get_actions_skips_supports_network_for_network_agnostic_providers(
+    mock_wallet_provider,
+):
+    """Test get_actions does not call supports_network when SUPPORTS_ALL_NETWORKS is set."""
+    provider = _mock_action_provider(supports_all_networks=True, supports_network=False)
+    agentkit = AgentKit(
+        AgentKitConfig(wallet_provider=mock_wallet_provider, action_providers=[provider])
+    )
+
+    actions = agentkit.get_actions()
+
+    assert [action.name for action in actions] == ["mock_action"]
+    provider.supports_network.assert_not_called()
+    provider.get_actions.assert_called_once_with(mock_wallet_provider)
+
+
+@pytest.mark.parametrize(
+    ("supports_network", "expected_actions"),
+    [(True, ["mock_action"]), (False, [])],
+    ids=["supported", "unsupported"],
+)
+def test_get_actions_checks_supports_network(
+    mock_wallet_provider, supports_network, expected_actions
+):
+    """Test get_actions filters on supports_network when SUPPORTS_ALL_NETWORKS is False."""
+    provider = _mock_action_provider(supports_all_networks=False, supports_network=supports_network)
+    agentkit = AgentKit(
+        AgentKitConfig(wallet_provider=mock_wallet_provider, action_providers=[provider])
+    )
+
+    actions = agentkit.get_actions()
+
+    assert [action.name for action in actions] == expected_actions
+    provider.supports_network.assert_called_once_with(MOCK_NETWORK)
@@ -25,6 +25,7 @@ MOCK_NETWORK_ID = "base-sepolia"
 
 # mock transaction constants
 MOCK_TRANSACTION_HASH = "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
+MOCK_TRANSACTION_HASH_BYTES = bytes.fromhex(MOCK_TRANSACTION_HASH[2:])
 MOCK_ADDRESS_TO = "0x1234567890123456789012345678901234567890"
 
 # mock gas constants
@@ -48,7 +49,7 @@ MOCK_SIGNATURE = "0x123456"
 def mock_cdp_client():
     """Create a mock for CDP Client with proper async handling."""
     with patch(
-        "coinbase_agentkit.wallet_providers.cdp_evm_wallet_provider.CdpClient", autospec=True
+        "coinbase_agentkit.wallet_providers.cdp_evm_wallet_provider.CdpClient"
     ) as mock_client_class:
         # Create a properly configured AsyncMock for the client
         mock_instance = AsyncMock()
@@ -88,6 +89,14 @@ def mock_account():
     return mock
 
 
+@pytest.fixture
+def mock_run_async(monkeypatch, mock_account):
+    """Patch CdpEvmWalletProvider._run_async to return the mock account."""
+    mock_run = Mock(return_value=mock_account)
+    monkeypatch.setattr(CdpEvmWalletProvider, "_run_async", mock_run)
+    return mock_run
+
+
 @pytest.fixture
 def mock_web3():
     """Create a mock Web3 instance."""
@@ -101,7 +110,7 @@ def mock_web3():
 
         mock_web3_instance.eth.estimate_gas.return_value = MOCK_GAS_LIMIT
 
-        mock_receipt = {"transactionHash": bytes.fromhex(MOCK_TRANSACTION_HASH[2:])}
+        mock_receipt = {"transactionHash": MOCK_TRANSACTION_HASH_BYTES}
         mock_web3_instance.eth.wait_for_transaction_receipt.return_value = mock_receipt
 
         mock_contract = Mock()
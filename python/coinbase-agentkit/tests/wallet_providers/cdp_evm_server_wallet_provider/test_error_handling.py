@@ -5,55 +5,50 @@ from unittest.mock import patch
 
 import pytest
 
+MOCK_READ_ABI = [
+    {
+        "name": "test",
+        "type": "function",
+        "inputs": [],
+        "outputs": [{"type": "string"}],
+    }
+]
+
 # =========================================================
 # error handling tests
 # =========================================================
 
 
-def test_network_error_handling(mocked_wallet_provider, mock_cdp_client, mock_web3):
-    """Test handling of network errors during transactions."""
-    # Test native transfer with network error
-    error_msg = "Network connection error"
-    mock_cdp_client.evm.send_transaction.side_effect = ConnectionError(error_msg)
+def test_native_transfer_network_error(mocked_wallet_provider, mock_cdp_client):
+    """Test native_transfer propagates network errors from the CDP client."""
+    mock_cdp_client.evm.send_transaction.side_effect = ConnectionError("Network connection error")
 
-    with pytest.raises(ConnectionError, match=error_msg):
+    with pytest.raises(ConnectionError, match="Network connection error"):
         mocked_wallet_provider.native_transfer("0x1234", Decimal("0.5"))
 
-    # Reset the mock for the next test
-    mock_cdp_client.evm.send_transaction.side_effect = None
 
-    # Test contract read error
-    contract_error = "Contract read error"
+def test_read_contract_error(mocked_wallet_provider, mock_web3):
+    """Test read_contract propagates errors from web3."""
     with (
         patch.object(
             mocked_wallet_provider._web3.eth,
             "contract",
-            side_effect=Exception(contract_error),
+            side_effect=Exception("Contract read error"),
         ),
-        pytest.raises(Exception, match=contract_error),
+        pytest.raises(Exception, match="Contract read error"),
     ):
-        mocked_wallet_provider.read_contract(
-            "0x1234",
-            [
-                {
-                    "name": "test",
-                    "type": "function",
-                    "inputs": [],
-                    "outputs": [{"type": "string"}],
-                }
-            ],
-            "test",
-        )
-
-    # Test transaction receipt timeout
-    timeout_error = "Timeout waiting for receipt"
+        mocked_wallet_provider.read_contract("0x1234", MOCK_READ_ABI, "test")
+
+
+def test_wait_for_transaction_receipt_error(mocked_wallet_provider, mock_web3):
+    """Test wait_for_transaction_receipt propagates errors from web3."""
     with (
         patch.object(
             mocked_wallet_provider._web3.eth,
             "wait_for_transaction_receipt",
-            side_effect=Exception(timeout_error),
+            side_effect=Exception("Timeout waiting for receipt"),
         ),
-        pytest.raises(Exception, match=timeout_error),
+        pytest.raises(Exception, match="Timeout waiting for receipt"),
     ):
         mocked_wallet_provider.wait_for_transaction_receipt("0x1234")
 
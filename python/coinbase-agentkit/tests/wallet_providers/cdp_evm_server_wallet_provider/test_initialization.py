@@ -23,58 +23,47 @@ from .conftest import (
 # =========================================================
 
 
-def test_init_with_config(mock_cdp_client, mock_account):
+def test_init_with_config(mock_cdp_client, mock_run_async):
     """Test initialization with config."""
-    with patch.object(CdpEvmWalletProvider, "_run_async") as mock_run:
-        mock_run.return_value = mock_account
+    config = CdpEvmWalletProviderConfig(
+        api_key_id=MOCK_API_KEY_ID,
+        api_key_secret=MOCK_API_KEY_SECRET,
+        wallet_secret=MOCK_WALLET_SECRET,
+        network_id=MOCK_NETWORK_ID,
+    )
 
-        config = CdpEvmWalletProviderConfig(
-            api_key_id=MOCK_API_KEY_ID,
-            api_key_secret=MOCK_API_KEY_SECRET,
-            wallet_secret=MOCK_WALLET_SECRET,
-            network_id=MOCK_NETWORK_ID,
-        )
+    provider = CdpEvmWalletProvider(config)
 
-        provider = CdpEvmWalletProvider(config)
+    assert provider.get_address() == MOCK_ADDRESS
+    assert provider.get_network().network_id == MOCK_NETWORK_ID
 
-        assert provider.get_address() == MOCK_ADDRESS
-        assert provider.get_network().network_id == MOCK_NETWORK_ID
 
-
-def test_init_with_env_vars(mock_cdp_client, mock_account):
+def test_init_with_env_vars(mock_cdp_client, mock_run_async):
     """Test initialization with environment variables."""
-    with (
-        patch.object(CdpEvmWalletProvider, "_run_async") as mock_run,
-        patch.dict(
-            os.environ,
-            {
-                "CDP_API_KEY_ID": MOCK_API_KEY_ID,
-                "CDP_API_KEY_SECRET": MOCK_API_KEY_SECRET,
-                "CDP_WALLET_SECRET": MOCK_WALLET_SECRET,
-                "NETWORK_ID": MOCK_NETWORK_ID,
-            },
-        ),
+    with patch.dict(
+        os.environ,
+        {
+            "CDP_API_KEY_ID": MOCK_API_KEY_ID,
+            "CDP_API_KEY_SECRET": MOCK_API_KEY_SECRET,
+            "CDP_WALLET_SECRET": MOCK_WALLET_SECRET,
+            "NETWORK_ID": MOCK_NETWORK_ID,
+        },
     ):
-        mock_run.return_value = mock_account
-
         provider = CdpEvmWalletProvider(CdpEvmWalletProviderConfig())
 
         assert provider.get_address() == MOCK_ADDRESS
         assert provider.get_network().network_id == MOCK_NETWORK_ID
 
 
-def test_init_with_default_network(mock_cdp_client, mock_account):
+def test_init_with_default_network(mock_cdp_client, mock_run_async):
     """Test initialization with default network when no network ID is provided."""
     with (
-        patch.object(CdpEvmWalletProvider, "_run_async") as mock_run,
         patch(
             "os.getenv",
             side_effect=lambda key, default=None: "base-sepolia" if key == "NETWORK_ID" else None,
         ),
         patch.dict(os.environ, {}, clear=True),
     ):
-        mock_run.return_value = mock_account
-
         config = CdpEvmWalletProviderConfig(
             api_key_id=MOCK_API_KEY_ID,
             api_key_secret=MOCK_API_KEY_SECRET,
@@ -96,34 +85,31 @@ def test_init_with_missing_credentials():
             CdpEvmWalletProvider(config)
 
 
-def test_init_with_invalid_network(mock_cdp_client):
+def test_init_with_invalid_network(mock_cdp_client, mock_run_async):
     """Test initialization with invalid network."""
-    # Use a known invalid network ID
-    with patch.object(
-        CdpEvmWalletProvider, "_run_async", side_effect=ValueError("Invalid network ID")
-    ):
-        config = CdpEvmWalletProviderConfig(
-            api_key_id=MOCK_API_KEY_ID,
-            api_key_secret=MOCK_API_KEY_SECRET,
-            wallet_secret=MOCK_WALLET_SECRET,
-            network_id="invalid-network",
-        )
+    mock_run_async.side_effect = ValueError("Invalid network ID")
 
-        with pytest.raises(ValueError, match="Failed to initialize CDP wallet"):
-            CdpEvmWalletProvider(config)
+    config = CdpEvmWalletProviderConfig(
+        api_key_id=MOCK_API_KEY_ID,
+        api_key_secret=MOCK_API_KEY_SECRET,
+        wallet_secret=MOCK_WALLET_SECRET,
+        network_id="invalid-network",
+    )
+
+    with pytest.raises(ValueError, match="Failed to initialize CDP wallet"):
+        CdpEvmWalletProvider(config)
 
 
-def test_init_with_account_creation_error(mock_cdp_client):
+def test_init_with_account_creation_error(mock_cdp_client, mock_run_async):
     """Test initialization when account creation fails."""
-    with patch.object(
-        CdpEvmWalletProvider, "_run_async", side_effect=Exception("Failed to create account")
-    ):
-        config = CdpEvmWalletProviderConfig(
-            api_key_id=MOCK_API_KEY_ID,
-            api_key_secret=MOCK_API_KEY_SECRET,
-            wallet_secret=MOCK_WALLET_SECRET,
-            network_id=MOCK_NETWORK_ID,
-        )
+    mock_run_async.side_effect = Exception("Failed to create account")
 
-        with pytest.raises(ValueError, match="Failed to initialize CDP wallet"):
-            CdpEvmWalletProvider(config)
+    config = CdpEvmWalletProviderConfig(
+        api_key_id=MOCK_API_KEY_ID,
+        api_key_secret=MOCK_API_KEY_SECRET,
+        wallet_secret=MOCK_WALLET_SECRET,
+        network_id=MOCK_NETWORK_ID,
+    )
+
+    with pytest.raises(ValueError, match="Failed to initialize CDP wallet"):
+        CdpEvmWalletProvider(config)
@@ -8,6 +8,7 @@ from .conftest import (
     MOCK_ADDRESS_TO,
     MOCK_ONE_ETH_WEI,
     MOCK_TRANSACTION_HASH,
+    MOCK_TRANSACTION_HASH_BYTES,
 )
 
 # =========================================================
@@ -27,42 +28,22 @@ def test_send_transaction(mocked_wallet_provider, mock_cdp_client):
     assert mock_cdp_client.evm.send_transaction.called
 
 
-def test_send_transaction_failure(mocked_wallet_provider, mock_cdp_client):
-    """Test send_transaction method when broadcast fails."""
-    transaction = {"to": MOCK_ADDRESS_TO, "value": MOCK_ONE_ETH_WEI, "data": "0x"}
-    error_msg = "Broadcast failed"
-
-    # Configure mock to raise an exception
-    mock_cdp_client.evm.send_transaction.side_effect = Exception(error_msg)
-
-    # Test that the exception is propagated
-    with pytest.raises(Exception, match=error_msg):
-        mocked_wallet_provider.send_transaction(transaction)
-
-
-def test_send_transaction_with_network_error(mocked_wallet_provider, mock_cdp_client):
-    """Test send_transaction method when network connection fails."""
-    transaction = {"to": MOCK_ADDRESS_TO, "value": MOCK_ONE_ETH_WEI, "data": "0x"}
-    error_msg = "Network connection error"
-
-    # Configure mock to raise a NetworkError
-    mock_cdp_client.evm.send_transaction.side_effect = ConnectionError(error_msg)
-
-    # Test that the exception is propagated
-    with pytest.raises(ConnectionError, match=error_msg):
-        mocked_wallet_provider.send_transaction(transaction)
-
-
-def test_send_transaction_timeout(mocked_wallet_provider, mock_cdp_client):
-    """Test send_transaction method when transaction times out."""
+@pytest.mark.parametrize(
+    ("error_type", "error_msg"),
+    [
+        (Exception, "Broadcast failed"),
+        (ConnectionError, "Network connection error"),
+        (TimeoutError, "Transaction timed out"),
+    ],
+    ids=["broadcast_failure", "network_error", "timeout"],
+)
+def test_send_transaction_failure(mocked_wallet_provider, mock_cdp_client, error_type, error_msg):
+    """Test send_transaction method propagates errors from the CDP client."""
     transaction = {"to": MOCK_ADDRESS_TO, "value": MOCK_ONE_ETH_WEI, "data": "0x"}
-    error_msg = "Transaction timed out"
 
-    # Configure mock to raise a TimeoutError
-    mock_cdp_client.evm.send_transaction.side_effect = TimeoutError(error_msg)
+    mock_cdp_client.evm.send_transaction.side_effect = error_type(error_msg)
 
-    # Test that the exception is propagated
-    with pytest.raises(TimeoutError, match=error_msg):
+    with pytest.raises(error_type, match=error_msg):
         mocked_wallet_provider.send_transaction(transaction)
 
 
@@ -72,7 +53,7 @@ def test_wait_for_transaction_receipt(mocked_wallet_provider, mock_web3):
 
     receipt = mocked_wallet_provider.wait_for_transaction_receipt(tx_hash)
 
-    assert receipt == {"transactionHash": bytes.fromhex(MOCK_TRANSACTION_HASH[2:])}
+    assert receipt == {"transactionHash": MOCK_TRANSACTION_HASH_BYTES}
     mock_web3.return_value.eth.wait_for_transaction_receipt.assert_called_once_with(
         tx_hash, timeout=120, poll_latency=0.1
     )
@@ -88,7 +69,7 @@ def test_wait_for_transaction_receipt_custom_timeout(mocked_wallet_provider, moc
         tx_hash, timeout=custom_timeout, poll_latency=custom_poll_latency
     )
 
-    assert receipt == {"transactionHash": bytes.fromhex(MOCK_TRANSACTION_HASH[2:])}
+    assert receipt == {"transactionHash": MOCK_TRANSACTION_HASH_BYTES}
     mock_web3.return_value.eth.wait_for_transaction_receipt.assert_called_once_with(
         tx_hash, timeout=custom_timeout, poll_latency=custom_poll_latency
     )
@@ -139,30 +120,19 @@ def test_native_transfer_small_amount(mocked_wallet_provider, mock_cdp_client, m
     assert mock_cdp_client.evm.send_transaction.called
 
 
-def test_native_transfer_failure(mocked_wallet_provider, mock_cdp_client, mock_web3):
-    """Test native_transfer method when transfer fails."""
-    to_address = MOCK_ADDRESS_TO
-    amount = Decimal("0.5")
-    error_msg = "Transfer failed"
-
-    # Configure error behavior
-    mock_cdp_client.evm.send_transaction.side_effect = Exception(error_msg)
-
-    # Test that the exception is propagated
-    with pytest.raises(Exception, match=error_msg):
-        mocked_wallet_provider.native_transfer(to_address, amount)
-
-
-def test_native_transfer_with_invalid_address(mocked_wallet_provider, mock_cdp_client, mock_web3):
-    """Test native_transfer method with invalid address."""
-    invalid_address = "not_a_valid_address"
-    amount = Decimal("1.0")
-    error_msg = "Invalid address format"
-
-    # Configure CDP client to raise exception for invalid addresses
-    # This simulates what would happen in the actual CDP client for invalid addresses
-    mock_cdp_client.evm.send_transaction.side_effect = ValueError(error_msg)
-
-    # Test that the exception is propagated
-    with pytest.raises(ValueError, match=error_msg):
-        mocked_wallet_provider.native_transfer(invalid_address, amount)
+@pytest.mark.parametrize(
+    ("to_address", "error_type", "error_msg"),
+    [
+        (MOCK_ADDRESS_TO, Exception, "Transfer failed"),
+        ("not_a_valid_address", ValueError, "Invalid address format"),
+    ],
+    ids=["transfer_failure", "invalid_address"],
+)
+def test_native_transfer_failure(
+    mocked_wallet_provider, mock_cdp_client, mock_web3, to_address, error_type, error_msg
+):
+    """Test native_transfer method propagates errors from the CDP client."""
+    mock_cdp_client.evm.send_transaction.side_effect = error_type(error_msg)
+
+    with pytest.raises(error_type, match=error_msg):
+        mocked_wallet_provider.native_transfer(to_address, Decimal("0.5"))
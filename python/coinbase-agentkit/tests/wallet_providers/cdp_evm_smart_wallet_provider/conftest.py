@@ -1,6 +1,9 @@
 """common test fixtures for CDP EVM smart wallet provider tests."""
 
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+import threading
+import weakref
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from eth_account.account import Account
@@ -9,6 +12,7 @@ from coinbase_agentkit.network import Network
 from coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider import (
     CdpSmartWalletProvider,
     CdpSmartWalletProviderConfig,
+    _get_session_manager,
 )
 
 # =========================================================
@@ -24,8 +28,11 @@ MOCK_NETWORK_ID = "base-sepolia"
 MOCK_CHAIN_ID = "84532"
 MOCK_PAYMASTER_URL = "https://paymaster.example.com"
 MOCK_RPC_URL = "https://sepolia.base.org"
+MOCK_WS_URL = "wss://sepolia.base.org"
+MOCK_RECEIPT_POLL_LATENCY = 1.0
 
 MOCK_TRANSACTION_HASH = "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890"
+MOCK_TRANSACTION_HASH_BYTES = bytes.fromhex(MOCK_TRANSACTION_HASH[2:])
 MOCK_ADDRESS_TO = "0x1234567890123456789012345678901234567890"
 
 MOCK_ONE_ETH_WEI = 1000000000000000000
@@ -39,6 +46,15 @@ MOCK_TRANSACTION = {"to": MOCK_ADDRESS_TO, "value": MOCK_ONE_ETH_WEI, "data": "0
 # =========================================================
 
 
+def run_coroutine(coro):
+    """Run a coroutine on a fresh event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
 @pytest.fixture
 def mock_cdp_client():
     """Create a mock for CDP client."""
@@ -90,7 +106,7 @@ def mock_web3():
 
         mock_web3_instance.eth.get_balance.return_value = MOCK_ONE_ETH_WEI
 
-        mock_receipt = {"transactionHash": bytes.fromhex(MOCK_TRANSACTION_HASH[2:])}
+        mock_receipt = {"transactionHash": MOCK_TRANSACTION_HASH_BYTES}
         mock_web3_instance.eth.wait_for_transaction_receipt.return_value = mock_receipt
 
         mock_contract = Mock()
@@ -105,6 +121,49 @@ def mock_web3():
         yield mock_web3
 
 
+@pytest.fixture
+def mock_async_web3():
+    """Create a mock AsyncWeb3 instance."""
+    with patch(
+        "coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.AsyncWeb3"
+    ) as mock_async_web3:
+        mock_async_web3_instance = Mock()
+        mock_async_web3.return_value = mock_async_web3_instance
+
+        mock_async_web3_instance.eth.get_balance = AsyncMock(return_value=MOCK_ONE_ETH_WEI)
+
+        mock_receipt = {"transactionHash": MOCK_TRANSACTION_HASH_BYTES}
+        mock_async_web3_instance.eth.wait_for_transaction_receipt = AsyncMock(
+            return_value=mock_receipt
+        )
+
+        mock_contract = Mock()
+        mock_function = Mock()
+        mock_function.call = AsyncMock(return_value="mock_result")
+        mock_contract.functions = {"testFunction": lambda *args: mock_function}
+        mock_async_web3_instance.eth.contract.return_value = mock_contract
+
+        yield mock_async_web3
+
+
+@pytest.fixture
+def clear_session_managers():
+    """Clear the shared RPC session managers before and after a test."""
+    _get_session_manager.cache_clear()
+    yield
+    _get_session_manager.cache_clear()
+
+
+@pytest.fixture
+def mock_batch(mock_web3):
+    """Create a mock for a Web3 batch request context."""
+    batch = Mock()
+    batch_context = MagicMock()
+    batch_context.__enter__.return_value = batch
+    mock_web3.return_value.batch_requests.return_value = batch_context
+    return batch
+
+
 @pytest.fixture
 def mock_asyncio():
     """Create a mock for asyncio."""
@@ -157,6 +216,7 @@ def mocked_wallet_provider(
     mock_owner,
     mock_smart_account,
     mock_web3,
+    mock_async_web3,
     mock_asyncio,
     mock_network_id_to_chain,
 ):
@@ -200,9 +260,17 @@ def mocked_wallet_provider(
         )
 
         provider._web3 = mock_web3.return_value
+        provider._batch_web3 = mock_web3.return_value
+        provider._batch_lock = threading.Lock()
+        provider._rpc_url = MOCK_RPC_URL
+        provider._async_web3 = mock_async_web3.return_value
+        provider._contract_caches = {}
         provider._owner = mock_owner
         provider._gas_limit_multiplier = 1.2
         provider._fee_per_gas_multiplier = 1
+        provider._receipt_poll_latency = MOCK_RECEIPT_POLL_LATENCY
+        provider._ws_url = None
+        provider._receipt_watchers = weakref.WeakKeyDictionary()
         provider.get_client = Mock(return_value=mock_cdp_client)
 
         # Update _run_async to properly handle coroutines
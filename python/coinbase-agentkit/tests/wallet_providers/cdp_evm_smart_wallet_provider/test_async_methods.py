@@ -0,0 +1,140 @@
+"""Tests for CDP EVM Smart Wallet Provider async methods."""
+
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from .conftest import (
+    MOCK_ADDRESS,
+    MOCK_ADDRESS_TO,
+    MOCK_ONE_ETH_WEI,
+    MOCK_PAYMASTER_URL,
+    MOCK_RECEIPT_POLL_LATENCY,
+    MOCK_RPC_URL,
+    MOCK_TRANSACTION,
+    MOCK_TRANSACTION_HASH,
+    MOCK_TRANSACTION_HASH_BYTES,
+    run_coroutine,
+)
+
+# =========================================================
+# async method tests
+# =========================================================
+
+
+def test_async_get_balance(mocked_wallet_provider, mock_async_web3):
+    """Test async_get_balance method."""
+    balance = run_coroutine(mocked_wallet_provider.async_get_balance())
+
+    assert balance == Decimal(MOCK_ONE_ETH_WEI)
+    mock_async_web3.return_value.eth.get_balance.assert_awaited_once_with(MOCK_ADDRESS)
+
+
+def test_async_web3_created_on_first_async_use(mocked_wallet_provider, mock_async_web3):
+    """Test the AsyncWeb3 instance is built once, on the first async call."""
+    mocked_wallet_provider._async_web3 = None
+
+    with patch(
+        "coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.AsyncHTTPProvider"
+    ) as mock_async_http_provider:
+        for _ in range(2):
+            run_coroutine(mocked_wallet_provider.async_get_balance())
+
+    mock_async_http_provider.assert_called_once_with(MOCK_RPC_URL)
+    mock_async_web3.assert_called_once_with(mock_async_http_provider.return_value)
+
+
+def test_async_read_contract(mocked_wallet_provider, mock_async_web3):
+    """Test async_read_contract method."""
+    abi = [{"name": "testFunction", "type": "function", "inputs": [], "outputs": []}]
+
+    result = run_coroutine(
+        mocked_wallet_provider.async_read_contract(
+            MOCK_ADDRESS_TO, abi, "testFunction", ["arg1"], block_identifier=12345678
+        )
+    )
+
+    assert result == "mock_result"
+    mock_async_web3.return_value.eth.contract.assert_called_once_with(
+        address=MOCK_ADDRESS_TO, abi=abi
+    )
+    mock_async_web3.return_value.eth.contract().functions[
+        "testFunction"
+    ]().call.assert_awaited_once_with(block_identifier=12345678)
+
+
+def test_async_read_contract_reuses_cached_contract(
+    mocked_wallet_provider, mock_web3, mock_async_web3
+):
+    """Test async_read_contract builds the async contract once per address and ABI."""
+    abi = [{"name": "testFunction", "type": "function", "inputs": [], "outputs": []}]
+
+    for _ in range(2):
+        run_coroutine(
+            mocked_wallet_provider.async_read_contract(MOCK_ADDRESS_TO, abi, "testFunction")
+        )
+
+    mock_async_web3.return_value.eth.contract.assert_called_once_with(
+        address=MOCK_ADDRESS_TO, abi=abi
+    )
+    mock_web3.return_value.eth.contract.assert_not_called()
+    assert list(mocked_wallet_provider._contract_caches) == [mock_async_web3.return_value]
+    assert (MOCK_ADDRESS_TO, id(abi)) in mocked_wallet_provider._contract_caches[
+        mock_async_web3.return_value
+    ]
+
+
+def test_async_wait_for_transaction_receipt(mocked_wallet_provider, mock_async_web3):
+    """Test async_wait_for_transaction_receipt uses the configured poll latency."""
+    receipt = run_coroutine(
+        mocked_wallet_provider.async_wait_for_transaction_receipt(MOCK_TRANSACTION_HASH)
+    )
+
+    assert receipt == {"transactionHash": MOCK_TRANSACTION_HASH_BYTES}
+    mock_async_web3.return_value.eth.wait_for_transaction_receipt.assert_awaited_once_with(
+        MOCK_TRANSACTION_HASH, timeout=120, poll_latency=MOCK_RECEIPT_POLL_LATENCY
+    )
+
+
+def test_async_wait_for_transaction_receipt_timeout(mocked_wallet_provider, mock_async_web3):
+    """Test async_wait_for_transaction_receipt when the transaction times out."""
+    mock_async_web3.return_value.eth.wait_for_transaction_receipt.side_effect = TimeoutError(
+        "Transaction timeout"
+    )
+
+    with pytest.raises(TimeoutError, match="Transaction timeout"):
+        run_coroutine(
+            mocked_wallet_provider.async_wait_for_transaction_receipt(
+                MOCK_TRANSACTION_HASH, timeout=1, poll_latency=0.5
+            )
+        )
+
+
+def test_async_send_transaction(mocked_wallet_provider, mock_cdp_client):
+    """Test async_send_transaction sends a user operation and closes the client."""
+    user_operation = Mock()
+    user_operation.user_op_hash = "mock_user_op_hash"
+    mock_cdp_client.evm.send_user_operation.return_value = user_operation
+
+    tx_hash = run_coroutine(mocked_wallet_provider.async_send_transaction(MOCK_TRANSACTION))
+
+    assert tx_hash == MOCK_TRANSACTION_HASH
+    send_kwargs = mock_cdp_client.evm.send_user_operation.await_args.kwargs
+    assert send_kwargs["network"] == "base-sepolia"
+    assert send_kwargs["paymaster_url"] == MOCK_PAYMASTER_URL
+    assert send_kwargs["calls"][0].to == MOCK_TRANSACTION["to"]
+    mock_cdp_client.evm.wait_for_user_operation.assert_awaited_once_with(
+        smart_account_address=MOCK_ADDRESS, user_op_hash="mock_user_op_hash"
+    )
+    mock_cdp_client.close.assert_awaited_once()
+
+
+def test_async_send_transaction_failure(mocked_wallet_provider, mock_cdp_client):
+    """Test async_send_transaction closes the client when the user operation fails."""
+    mock_cdp_client.evm.send_user_operation.side_effect = Exception("User operation failed")
+
+    with pytest.raises(Exception, match="User operation failed"):
+        run_coroutine(mocked_wallet_provider.async_send_transaction(MOCK_TRANSACTION))
+
+    mock_cdp_client.close.assert_awaited_once()
@@ -1,16 +1,27 @@
 """tests for CDP EVM smart wallet provider basic methods."""
 
+import json
+import threading
 from decimal import Decimal
+from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
+from web3 import Web3
 
 from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider import (
+    _PooledHTTPProvider,
+    _PooledHTTPSessionManager,
+)
 
 from .conftest import (
     MOCK_ADDRESS,
+    MOCK_ADDRESS_TO,
     MOCK_CHAIN_ID,
     MOCK_NETWORK_ID,
     MOCK_ONE_ETH_WEI,
+    MOCK_RPC_URL,
 )
 
 # =========================================================
@@ -79,3 +90,61 @@ def test_get_balance_with_connection_error(mocked_wallet_provider, mock_web3):
 
     with pytest.raises(ConnectionError, match="Network connection error"):
         mocked_wallet_provider.get_balance()
+
+
+def test_get_balances(mocked_wallet_provider, mock_web3, mock_batch):
+    """Test get_balances batches one eth_getBalance request per address."""
+    mock_batch.execute.return_value = [MOCK_ONE_ETH_WEI, 0]
+
+    balances = mocked_wallet_provider.get_balances([MOCK_ADDRESS, MOCK_ADDRESS_TO])
+
+    assert balances == [Decimal(MOCK_ONE_ETH_WEI), Decimal("0")]
+    assert mock_batch.add.call_count == 2
+    mock_web3.return_value.eth.get_balance.assert_any_call(MOCK_ADDRESS)
+    mock_web3.return_value.eth.get_balance.assert_any_call(MOCK_ADDRESS_TO)
+    mock_batch.execute.assert_called_once()
+
+
+def test_get_balances_empty(mocked_wallet_provider, mock_web3):
+    """Test get_balances with no addresses skips the RPC request."""
+    assert mocked_wallet_provider.get_balances([]) == []
+    mock_web3.return_value.batch_requests.assert_not_called()
+
+
+def test_get_balance_while_batch_is_open(mocked_wallet_provider):
+    """Test a single read made while another thread's batch is open gets a real result."""
+    session_manager = _PooledHTTPSessionManager(2)
+    mocked_wallet_provider._web3 = Web3(_PooledHTTPProvider(MOCK_RPC_URL, session_manager))
+    mocked_wallet_provider._batch_web3 = Web3(_PooledHTTPProvider(MOCK_RPC_URL, session_manager))
+    batch_sent = threading.Event()
+    single_read_done = threading.Event()
+
+    def post(session, endpoint_uri, data=None, **kwargs):
+        payload = json.loads(data)
+        if isinstance(payload, list):
+            # Hold the batch open until the single read has completed
+            batch_sent.set()
+            single_read_done.wait(5)
+            body = [{"jsonrpc": "2.0", "id": request["id"], "result": "0x0"} for request in payload]
+        else:
+            body = {"jsonrpc": "2.0", "id": payload["id"], "result": hex(MOCK_ONE_ETH_WEI)}
+        response = MagicMock(content=json.dumps(body).encode())
+        response.__enter__.return_value = response
+        return response
+
+    balances = []
+    with patch.object(requests.Session, "post", autospec=True, side_effect=post):
+        batch_thread = threading.Thread(
+            target=lambda: balances.extend(
+                mocked_wallet_provider.get_balances([MOCK_ADDRESS, MOCK_ADDRESS_TO])
+            )
+        )
+        batch_thread.start()
+        assert batch_sent.wait(5)
+
+        balance = mocked_wallet_provider.get_balance()
+        single_read_done.set()
+        batch_thread.join()
+
+    assert balance == Decimal(MOCK_ONE_ETH_WEI)
+    assert balances == [Decimal(0), Decimal(0)]
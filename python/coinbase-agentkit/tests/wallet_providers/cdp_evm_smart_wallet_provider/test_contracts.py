@@ -5,6 +5,8 @@ from unittest.mock import Mock
 import pytest
 from web3.exceptions import ContractLogicError
 
+from coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider import CONTRACT_CACHE_SIZE
+
 from .conftest import MOCK_ADDRESS_TO
 
 # =========================================================
@@ -37,6 +39,42 @@ def test_read_contract(mocked_wallet_provider, mock_web3):
     )
 
 
+def test_read_contract_reuses_cached_contract(mocked_wallet_provider, mock_web3):
+    """Test read_contract builds the contract once per address and ABI object."""
+    abi = [{"name": "testFunction", "type": "function", "inputs": [], "outputs": []}]
+
+    mocked_wallet_provider.read_contract(MOCK_ADDRESS_TO, abi, "testFunction")
+    mocked_wallet_provider.read_contract(MOCK_ADDRESS_TO, abi, "testFunction")
+
+    mock_web3.return_value.eth.contract.assert_called_once_with(address=MOCK_ADDRESS_TO, abi=abi)
+
+
+def test_read_contract_cache_keyed_by_abi(mocked_wallet_provider, mock_web3):
+    """Test read_contract builds a new contract for a different ABI object."""
+    abi = [{"name": "testFunction", "type": "function", "inputs": [], "outputs": []}]
+    other_abi = list(abi)
+
+    mocked_wallet_provider.read_contract(MOCK_ADDRESS_TO, abi, "testFunction")
+    mocked_wallet_provider.read_contract(MOCK_ADDRESS_TO, other_abi, "testFunction")
+
+    assert mock_web3.return_value.eth.contract.call_count == 2
+
+
+def test_read_contract_cache_is_bounded(mocked_wallet_provider, mock_web3):
+    """Test read_contract evicts the oldest contracts past the cache size."""
+    abis = [
+        [{"name": "testFunction", "type": "function", "inputs": [], "outputs": []}]
+        for _ in range(CONTRACT_CACHE_SIZE + 1)
+    ]
+
+    for abi in abis:
+        mocked_wallet_provider.read_contract(MOCK_ADDRESS_TO, abi, "testFunction")
+
+    cache = mocked_wallet_provider._contract_caches[mock_web3.return_value]
+    assert len(cache) == CONTRACT_CACHE_SIZE
+    assert (MOCK_ADDRESS_TO, id(abis[0])) not in cache
+
+
 def test_read_contract_empty_args(mocked_wallet_provider, mock_web3):
     """Test read_contract method with empty args."""
     contract_address = MOCK_ADDRESS_TO
@@ -211,3 +249,31 @@ def test_read_contract_with_invalid_address(mocked_wallet_provider, mock_web3):
 
     with pytest.raises(ValueError, match="Invalid address"):
         mocked_wallet_provider.read_contract(invalid_address, abi, "testFunction")
+
+
+def test_read_contracts(mocked_wallet_provider, mock_web3, mock_batch):
+    """Test read_contracts batches every call into one request."""
+    abi = [{"name": "testFunction", "type": "function", "inputs": [], "outputs": []}]
+    mock_batch.execute.return_value = ["first", "second"]
+
+    result = mocked_wallet_provider.read_contracts(
+        [
+            (MOCK_ADDRESS_TO, abi, "testFunction", ["arg1"]),
+            (MOCK_ADDRESS_TO, abi, "testFunction", None),
+        ],
+        block_identifier=12345678,
+    )
+
+    assert result == ["first", "second"]
+    mock_web3.return_value.eth.contract.assert_called_once_with(address=MOCK_ADDRESS_TO, abi=abi)
+    assert mock_batch.add.call_count == 2
+    mock_web3.return_value.eth.contract().functions["testFunction"]().call.assert_called_with(
+        block_identifier=12345678
+    )
+    mock_batch.execute.assert_called_once()
+
+
+def test_read_contracts_empty(mocked_wallet_provider, mock_web3):
+    """Test read_contracts with no calls skips the RPC request."""
+    assert mocked_wallet_provider.read_contracts([]) == []
+    mock_web3.return_value.batch_requests.assert_not_called()
@@ -1,14 +1,21 @@
 """tests for CDP EVM Smart Wallet provider initialization."""
 
+import gc
 import os
-from unittest.mock import Mock, patch
+import threading
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+import requests
 from eth_account.account import Account
+from pydantic import ValidationError
 
 from coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider import (
     CdpSmartWalletProvider,
     CdpSmartWalletProviderConfig,
+    _create_rpc_session,
+    _PooledHTTPProvider,
+    _PooledHTTPSessionManager,
 )
 
 from .conftest import (
@@ -20,11 +27,38 @@ from .conftest import (
     MOCK_WALLET_SECRET,
 )
 
+MOCK_RPC_RESPONSE = b'{"jsonrpc": "2.0", "id": 0, "result": "0x1"}'
+
 # =========================================================
 # initialization tests
 # =========================================================
 
 
+def _sessions_used_for_requests(*http_providers, in_thread=False):
+    """Send one RPC request through each provider on a single thread and return the sessions used."""
+    response = MagicMock(content=MOCK_RPC_RESPONSE)
+    response.__enter__.return_value = response
+
+    def send_requests():
+        for http_provider in http_providers:
+            http_provider.make_request("eth_chainId", [])
+
+    with patch.object(requests.Session, "post", autospec=True, return_value=response) as mock_post:
+        if in_thread:
+            thread = threading.Thread(target=send_requests)
+            thread.start()
+            thread.join()
+        else:
+            send_requests()
+
+    return [call.args[0] for call in mock_post.call_args_list]
+
+
+def _pool_size(session, prefix):
+    """Get the maximum number of pooled connections per host of a session's adapter."""
+    return session.get_adapter(prefix).poolmanager.connection_pool_kw["maxsize"]
+
+
 def test_init_with_config(mock_cdp_client, mock_asyncio, mock_network_id_to_chain):
     """Test initialization with full configuration."""
     # Setup the mocks for async operation
@@ -66,6 +100,7 @@ def test_init_with_config(mock_cdp_client, mock_asyncio, mock_network_id_to_chai
     assert provider._api_key_secret == MOCK_API_KEY_SECRET
     assert provider._wallet_secret == MOCK_WALLET_SECRET
     assert provider._paymaster_url == MOCK_PAYMASTER_URL
+    assert provider._async_web3 is None
 
 
 def test_init_with_env_vars(mock_cdp_client, mock_asyncio, mock_network_id_to_chain):
@@ -193,3 +228,108 @@ def test_init_with_invalid_network_id(mock_cdp_client, mock_asyncio):
     # Check that the error message contains the invalid network ID
     assert "Failed to initialize CDP smart wallet" in str(excinfo.value)
     assert invalid_network_id in str(excinfo.value.__cause__)
+
+
+@pytest.mark.usefixtures("clear_session_managers")
+def test_init_with_rpc_pool_size(mock_cdp_client, mock_asyncio, mock_network_id_to_chain):
+    """Test initialization passes the configured pool size to the RPC session."""
+    config = CdpSmartWalletProviderConfig(
+        api_key_id=MOCK_API_KEY_ID,
+        api_key_secret=MOCK_API_KEY_SECRET,
+        wallet_secret=MOCK_WALLET_SECRET,
+        network_id=MOCK_NETWORK_ID,
+        owner="0x123456789012345678901234567890123456789012",
+        address=MOCK_ADDRESS,
+        rpc_pool_size=8,
+    )
+
+    provider = CdpSmartWalletProvider(config)
+    [session] = _sessions_used_for_requests(provider._web3.provider)
+
+    assert _pool_size(session, "https://") == 8
+
+
+@pytest.mark.parametrize("field", ["rpc_pool_size", "receipt_poll_latency"])
+@pytest.mark.parametrize("value", [0, -1])
+def test_config_rejects_non_positive_values(field, value):
+    """Test the pool size and receipt poll latency must be positive."""
+    with pytest.raises(ValidationError, match=field):
+        CdpSmartWalletProviderConfig(**{field: value})
+
+
+@pytest.mark.usefixtures("clear_session_managers")
+def test_init_shares_rpc_sessions(mock_cdp_client, mock_asyncio, mock_network_id_to_chain):
+    """Test providers share one pooled session per thread but not their HTTP provider."""
+    config = CdpSmartWalletProviderConfig(
+        api_key_id=MOCK_API_KEY_ID,
+        api_key_secret=MOCK_API_KEY_SECRET,
+        wallet_secret=MOCK_WALLET_SECRET,
+        network_id=MOCK_NETWORK_ID,
+        owner="0x123456789012345678901234567890123456789012",
+        address=MOCK_ADDRESS,
+    )
+
+    first = CdpSmartWalletProvider(config)
+    second = CdpSmartWalletProvider(config)
+    other = CdpSmartWalletProvider(config.model_copy(update={"rpc_url": "https://other.rpc.url"}))
+
+    first_session, second_session, other_session = _sessions_used_for_requests(
+        first._web3.provider, second._web3.provider, other._web3.provider, in_thread=True
+    )
+
+    assert first._web3.provider is not second._web3.provider
+    assert second_session is first_session
+    assert other_session is first_session
+    assert _pool_size(first_session, "https://") == 50
+
+
+def test_http_provider_uses_pooled_session_on_every_thread():
+    """Test requests from any thread go through a pooled session."""
+    http_provider = _PooledHTTPProvider("https://pooled.rpc.url", _PooledHTTPSessionManager(8))
+
+    [main_session] = _sessions_used_for_requests(http_provider)
+    [thread_session] = _sessions_used_for_requests(http_provider, in_thread=True)
+
+    assert thread_session is not main_session
+    assert _pool_size(main_session, "https://") == 8
+    assert _pool_size(thread_session, "https://") == 8
+
+
+def test_http_provider_closes_thread_session_when_thread_exits():
+    """Test a thread's pooled session is closed once the thread exits."""
+    http_provider = _PooledHTTPProvider("https://pooled.rpc.url", _PooledHTTPSessionManager(8))
+
+    with patch.object(requests.Session, "close", autospec=True) as mock_close:
+        [thread_session] = _sessions_used_for_requests(http_provider, in_thread=True)
+        gc.collect()
+
+    mock_close.assert_called_once_with(thread_session)
+
+
+@pytest.mark.parametrize(
+    ("method", "expected_attempts"),
+    [("eth_getBalance", 3), ("eth_sendRawTransaction", 1)],
+    ids=["read", "send"],
+)
+def test_http_provider_retries_only_read_methods(method, expected_attempts):
+    """Test failed requests are retried for read-only methods but never resent for sends."""
+    http_provider = _PooledHTTPProvider("https://pooled.rpc.url", _PooledHTTPSessionManager(8))
+
+    with (
+        patch.object(
+            requests.Session, "post", autospec=True, side_effect=requests.ConnectionError
+        ) as mock_post,
+        patch("web3.providers.rpc.rpc.time.sleep"),
+        pytest.raises(requests.ConnectionError),
+    ):
+        http_provider.make_request(method, [])
+
+    assert mock_post.call_count == expected_attempts
+
+
+def test_create_rpc_session_pool_size():
+    """Test the RPC session mounts a connection pool of the requested size."""
+    session = _create_rpc_session(8)
+
+    for prefix in ("http://", "https://"):
+        assert _pool_size(session, prefix) == 8
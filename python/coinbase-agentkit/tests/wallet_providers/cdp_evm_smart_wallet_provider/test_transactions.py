@@ -1,12 +1,22 @@
 """Tests for CDP EVM Smart Wallet Provider transaction operations."""
 
+import asyncio
 from decimal import Decimal
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from cdp.evm_call_types import EncodedCall
-
-from .conftest import MOCK_ADDRESS_TO, MOCK_ONE_ETH_WEI, MOCK_TRANSACTION_HASH
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from .conftest import (
+    MOCK_ADDRESS_TO,
+    MOCK_ONE_ETH_WEI,
+    MOCK_RECEIPT_POLL_LATENCY,
+    MOCK_TRANSACTION_HASH,
+    MOCK_TRANSACTION_HASH_BYTES,
+    MOCK_WS_URL,
+    run_coroutine,
+)
 
 # =========================================================
 # transaction tests
@@ -285,9 +295,21 @@ def test_wait_for_transaction_receipt(mocked_wallet_provider, mock_web3):
 
     receipt = mocked_wallet_provider.wait_for_transaction_receipt(tx_hash)
 
-    assert receipt == {"transactionHash": bytes.fromhex(MOCK_TRANSACTION_HASH[2:])}
+    assert receipt == {"transactionHash": MOCK_TRANSACTION_HASH_BYTES}
+    mock_web3.return_value.eth.wait_for_transaction_receipt.assert_called_once_with(
+        tx_hash, timeout=120, poll_latency=MOCK_RECEIPT_POLL_LATENCY
+    )
+
+
+def test_wait_for_transaction_receipt_configured_poll_latency(mocked_wallet_provider, mock_web3):
+    """Test wait_for_transaction_receipt uses the configured receipt poll latency."""
+    tx_hash = "0x1234567890123456789012345678901234567890123456789012345678901234"
+    mocked_wallet_provider._receipt_poll_latency = 0.25
+
+    mocked_wallet_provider.wait_for_transaction_receipt(tx_hash)
+
     mock_web3.return_value.eth.wait_for_transaction_receipt.assert_called_once_with(
-        tx_hash, timeout=120, poll_latency=0.1
+        tx_hash, timeout=120, poll_latency=0.25
     )
 
 
@@ -330,6 +352,150 @@ def test_wait_for_transaction_receipt_timeout(mocked_wallet_provider, mock_web3)
         mocked_wallet_provider.wait_for_transaction_receipt(tx_hash)
 
 
+def _mock_ws_web3(receipts, heads=1):
+    """Create a mock WebSocket AsyncWeb3 that yields new heads and returns receipts in order."""
+    w3 = MagicMock()
+    w3.__aenter__.return_value = w3
+    w3.eth.subscribe = AsyncMock(return_value="0xsubscription")
+    w3.eth.get_transaction_receipt = AsyncMock(side_effect=receipts)
+
+    async def process_subscriptions():
+        for number in range(heads):
+            yield {"number": number}
+        # Keep the subscription open without further heads
+        await asyncio.sleep(3600)
+
+    w3.socket.process_subscriptions = process_subscriptions
+    return w3
+
+
+def test_wait_for_transaction_receipt_with_ws_url(mocked_wallet_provider, mock_web3):
+    """Test wait_for_transaction_receipt waits on new heads instead of polling with a ws_url."""
+    mocked_wallet_provider._ws_url = MOCK_WS_URL
+    mock_receipt = {"transactionHash": MOCK_TRANSACTION_HASH_BYTES}
+
+    with patch.object(
+        mocked_wallet_provider, "_run_async", side_effect=lambda coro: coro.close() or mock_receipt
+    ) as mock_run_async:
+        receipt = mocked_wallet_provider.wait_for_transaction_receipt(MOCK_TRANSACTION_HASH)
+
+    assert receipt == mock_receipt
+    assert mock_run_async.call_args[0][0].__name__ == "_wait_for_receipt_on_new_heads"
+    mock_web3.return_value.eth.wait_for_transaction_receipt.assert_not_called()
+
+
+def test_wait_for_receipt_on_new_heads(mocked_wallet_provider):
+    """Test the receipt is checked once up front and then once per new head."""
+    mocked_wallet_provider._ws_url = MOCK_WS_URL
+    mock_receipt = {"transactionHash": MOCK_TRANSACTION_HASH_BYTES}
+    w3 = _mock_ws_web3(
+        [TransactionNotFound("not found"), TransactionNotFound("not found"), mock_receipt], heads=2
+    )
+
+    with (
+        patch("coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.asyncio", asyncio),
+        patch(
+            "coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.AsyncWeb3",
+            return_value=w3,
+        ),
+        patch(
+            "coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.WebSocketProvider"
+        ) as mock_ws_provider,
+    ):
+        receipt = run_coroutine(
+            mocked_wallet_provider._wait_for_receipt_on_new_heads(MOCK_TRANSACTION_HASH, 5)
+        )
+
+    assert receipt == mock_receipt
+    mock_ws_provider.assert_called_once_with(MOCK_WS_URL)
+    w3.eth.subscribe.assert_awaited_once_with("newHeads")
+    assert w3.eth.get_transaction_receipt.await_count == 3
+
+
+def test_wait_for_receipt_on_new_heads_already_mined(mocked_wallet_provider):
+    """Test an already mined transaction returns without waiting for a new head."""
+    mocked_wallet_provider._ws_url = MOCK_WS_URL
+    mock_receipt = {"transactionHash": MOCK_TRANSACTION_HASH_BYTES}
+    w3 = _mock_ws_web3([mock_receipt], heads=0)
+
+    with (
+        patch("coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.asyncio", asyncio),
+        patch(
+            "coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.AsyncWeb3",
+            return_value=w3,
+        ),
+        patch("coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.WebSocketProvider"),
+    ):
+        receipt = run_coroutine(
+            mocked_wallet_provider._wait_for_receipt_on_new_heads(MOCK_TRANSACTION_HASH, 5)
+        )
+
+    assert receipt == mock_receipt
+    w3.eth.get_transaction_receipt.assert_awaited_once_with(MOCK_TRANSACTION_HASH)
+
+
+def test_wait_for_receipt_on_new_heads_shares_subscription(mocked_wallet_provider):
+    """Test concurrent waits on one event loop share a single connection and subscription."""
+    mocked_wallet_provider._ws_url = MOCK_WS_URL
+    other_tx_hash = "0x" + "12" * 32
+    first_receipt = {"transactionHash": MOCK_TRANSACTION_HASH_BYTES}
+    second_receipt = {"transactionHash": bytes.fromhex(other_tx_hash[2:])}
+    responses = {
+        MOCK_TRANSACTION_HASH: iter([None, first_receipt]),
+        other_tx_hash: iter([None, None, second_receipt]),
+    }
+
+    def get_transaction_receipt(tx_hash):
+        receipt = next(responses[tx_hash])
+        if receipt is None:
+            raise TransactionNotFound("not found")
+        return receipt
+
+    w3 = _mock_ws_web3([], heads=2)
+    w3.eth.get_transaction_receipt.side_effect = get_transaction_receipt
+
+    async def wait_for_both():
+        return await asyncio.gather(
+            mocked_wallet_provider._wait_for_receipt_on_new_heads(MOCK_TRANSACTION_HASH, 5),
+            mocked_wallet_provider._wait_for_receipt_on_new_heads(other_tx_hash, 5),
+        )
+
+    with (
+        patch("coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.asyncio", asyncio),
+        patch(
+            "coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.AsyncWeb3",
+            return_value=w3,
+        ) as mock_ws_web3,
+        patch("coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.WebSocketProvider"),
+    ):
+        receipts = run_coroutine(wait_for_both())
+
+    assert receipts == [first_receipt, second_receipt]
+    mock_ws_web3.assert_called_once()
+    w3.eth.subscribe.assert_awaited_once_with("newHeads")
+    assert w3.eth.get_transaction_receipt.await_count == 5
+    w3.__aexit__.assert_awaited_once()
+
+
+def test_wait_for_receipt_on_new_heads_timeout(mocked_wallet_provider):
+    """Test waiting on new heads raises TimeExhausted when the transaction is not mined."""
+    mocked_wallet_provider._ws_url = MOCK_WS_URL
+    w3 = _mock_ws_web3([TransactionNotFound("not found")] * 2, heads=1)
+
+    with (
+        patch("coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.asyncio", asyncio),
+        patch(
+            "coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.AsyncWeb3",
+            return_value=w3,
+        ),
+        patch("coinbase_agentkit.wallet_providers.cdp_smart_wallet_provider.WebSocketProvider"),
+        pytest.raises(TimeExhausted, match="is not in the chain after 0.1 seconds"),
+    ):
+        run_coroutine(
+            mocked_wallet_provider._wait_for_receipt_on_new_heads(MOCK_TRANSACTION_HASH, 0.1)
+        )
+
+
 def test_native_transfer(mocked_wallet_provider, mock_cdp_client, mock_smart_account, mock_web3):
     """Test native_transfer method."""
     to_address = MOCK_ADDRESS_TO
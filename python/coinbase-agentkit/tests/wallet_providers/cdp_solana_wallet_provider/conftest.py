@@ -46,7 +46,7 @@ MOCK_SIGNATURE = (
 def mock_cdp_client():
     """Create a mock for CDP Client with proper async handling."""
     with patch(
-        "coinbase_agentkit.wallet_providers.cdp_solana_wallet_provider.CdpClient", autospec=True
+        "coinbase_agentkit.wallet_providers.cdp_solana_wallet_provider.CdpClient"
     ) as mock_client_class:
         # Create a properly configured AsyncMock for the client
         mock_instance = AsyncMock()
@@ -2,9 +2,12 @@
 
 from unittest.mock import patch
 
+import pytest
+
 from .conftest import (
     MOCK_BASE_FEE_PER_GAS,
     MOCK_FEE_MULTIPLIER,
+    MOCK_ONE_ETH_WEI,
     MOCK_PRIORITY_FEE_WEI,
 )
 
@@ -13,29 +16,26 @@ from .conftest import (
 # =========================================================
 
 
-def test_estimate_fees(wallet_provider, mock_web3):
-    """Test estimate_fees method."""
-    with patch.object(wallet_provider, "_fee_per_gas_multiplier", MOCK_FEE_MULTIPLIER):
-        max_priority_fee, max_fee = wallet_provider.estimate_fees()
-
-        assert max_fee > max_priority_fee
-        assert max_priority_fee == MOCK_PRIORITY_FEE_WEI
-
-
-def test_estimate_fees_with_multiplier(wallet_provider, mock_web3):
-    """Test estimate_fees method with custom fee multiplier."""
-    mock_web3.return_value.eth.get_block.return_value = {"baseFeePerGas": MOCK_BASE_FEE_PER_GAS}
-    custom_fee_multiplier = 2.0
-
-    mock_web3.to_wei.return_value = 100000000
-    expected_priority_fee = int(100000000 * custom_fee_multiplier)
+@pytest.mark.parametrize(
+    ("fee_multiplier", "base_priority_fee_wei", "expected_priority_fee"),
+    [
+        (MOCK_FEE_MULTIPLIER, MOCK_ONE_ETH_WEI, MOCK_PRIORITY_FEE_WEI),
+        (2.0, 100000000, 200000000),
+    ],
+    ids=["default_multiplier", "custom_multiplier"],
+)
+def test_estimate_fees(
+    wallet_provider, mock_web3, fee_multiplier, base_priority_fee_wei, expected_priority_fee
+):
+    """Test estimate_fees method applies the fee multiplier to base and priority fees."""
+    mock_web3.to_wei.return_value = base_priority_fee_wei
 
-    with patch.object(wallet_provider, "_fee_per_gas_multiplier", custom_fee_multiplier):
+    with patch.object(wallet_provider, "_fee_per_gas_multiplier", fee_multiplier):
         max_priority_fee, max_fee = wallet_provider.estimate_fees()
 
-        assert max_priority_fee == expected_priority_fee
-        assert max_fee > max_priority_fee
-        assert max_fee >= (MOCK_BASE_FEE_PER_GAS * 2) + max_priority_fee
+    assert max_priority_fee == expected_priority_fee
+    assert max_fee > max_priority_fee
+    assert max_fee == int(MOCK_BASE_FEE_PER_GAS * fee_multiplier) + max_priority_fee
 
-        mock_web3.return_value.eth.get_block.assert_called_once_with("latest")
-        mock_web3.to_wei.assert_called_once_with(0.1, "gwei")
+    mock_web3.return_value.eth.get_block.assert_called_once_with("latest")
+    mock_web3.to_wei.assert_called_once_with(0.1, "gwei")
@@ -82,7 +82,7 @@ CDP_SUPPORTED_NETWORKS = {
     "polygon-mumbai",
 }
 
-VALID_PACKAGE_NAME_REGEX = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+VALID_PACKAGE_NAME_REGEX = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*\Z")
 
 
 def get_template_path(template_name: str, templates_path: str | None = None) -> str: